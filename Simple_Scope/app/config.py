@@ -2,26 +2,198 @@
 Configuration management for the application
 """
 
-from dataclasses import dataclass, field, asdict
+import atexit
+from collections import deque
+from dataclasses import dataclass, field, fields
+from functools import cache
 import json
 import logging
-import re
+import os
+import queue
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 
+from app.utils import invalidate_filename_cache
 from app.version import __version__
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 # Use SimpleScope namespace to integrate with app's logging hierarchy
 logger = logging.getLogger("SimpleScope.config")
 
+# Delay before a pending auto-save is written; repeated sets within this window coalesce
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Resolved once at import; Path.home() hits the environment on every call
+_APP_DATA_DIR = Path.home() / ".simple_scope"
+_DEFAULT_CONFIG_FILE = _APP_DATA_DIR / "config.json"
+
+# Number of entries kept in recent_directories
+MAX_RECENT_DIRECTORIES = 5
+
+
+def _dumps(obj: dict) -> bytes:
+    """Serialize config dict to the indented JSON users read and hand-edit"""
+    # stdlib json: orjson can only indent by 2, which would reformat existing files
+    return json.dumps(obj, indent=4).encode('utf-8')
+
+
+def _loads(data: bytes) -> dict:
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
+
+class _ConfigWriter:
+    """Background writer for one config file, shared by every AppConfig using it.
+
+    Kept outside AppConfig so config instances hold no threads or locks (they
+    stay copyable and collectable) and only one writer thread runs per file.
+    """
+
+    def __init__(self, config_file: Path):
+        self.config_file = config_file
+        self.last_written_bytes: bytes | None = None  # what is on disk, to skip no-op writes
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._queue_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(self, payload: bytes | None, done: threading.Event | None) -> None:
+        """Put a save request in the single-slot queue, replacing any pending one.
+
+        A replaced request's payload is kept when payload is None, and its
+        completion events are carried over so earlier flush() callers are
+        released once the newer request is written.
+        """
+        with self._queue_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="AppConfigWriter", daemon=True)
+                self._thread.start()
+
+            events = [done] if done is not None else []
+            try:
+                pending_payload, pending_events = self._queue.get_nowait()
+                events += pending_events
+                if payload is None:
+                    payload = pending_payload
+            except queue.Empty:
+                pass
+            self._queue.put_nowait((payload, events))
+
+    def _loop(self) -> None:
+        """Background thread: debounce queued payloads and write the newest"""
+        while True:
+            payload, events = self._queue.get()
+            # Wait for the burst to settle; newer payloads supersede this one
+            while not events:
+                try:
+                    newer, events = self._queue.get(timeout=SAVE_DEBOUNCE_SECONDS)
+                except queue.Empty:
+                    break
+                if newer is not None:
+                    payload = newer
+            try:
+                if payload is not None:
+                    self.write(payload, durable=bool(events))
+            except Exception as e:
+                logger.error(f"Error saving configuration: {str(e)}")
+            finally:
+                for event in events:
+                    event.set()
+
+    @property
+    def started(self) -> bool:
+        """Whether a save was ever scheduled through this writer"""
+        return self._thread is not None
+
+    def flush(self, payload: bytes | None = None, timeout: float = 5.0) -> None:
+        """Write payload (or whatever is pending) now and wait for the write"""
+        if self._thread is None:
+            return  # nothing was ever scheduled
+        done = threading.Event()
+        self.enqueue(payload, done)
+        done.wait(timeout)
+
+    def write(self, payload: bytes, durable: bool = False) -> None:
+        """Write serialized config unless it matches what is already on disk"""
+        with self._write_lock:
+            if payload == self.last_written_bytes:
+                logger.debug("Config unchanged, skipping write")
+                return
+
+            # Ensure directory exists
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(payload, durable)
+            self.last_written_bytes = payload
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Config saved to: {self.config_file}")
+
+    def _write_atomic(self, payload: bytes, durable: bool = False) -> None:
+        """Write payload to a uniquely named temp file and rename it over the config file.
+
+        Args:
+            payload: Serialized config bytes
+            durable: fsync the temp file before the rename
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self.config_file.parent,
+                                        prefix=f"{self.config_file.name}.", suffix=".tmp")
+        try:
+            # Buffered file object: write() loops until the whole payload is out
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_name, self.config_file)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+# Config file path -> its writer; created on first save, flushed at exit
+_writers: dict[Path, _ConfigWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _writer_for(config_file: Path) -> _ConfigWriter:
+    """The shared writer for config_file, created on first use"""
+    with _writers_lock:
+        writer = _writers.get(config_file)
+        if writer is None:
+            if not _writers:
+                atexit.register(_flush_writers)
+            writer = _writers[config_file] = _ConfigWriter(config_file)
+        return writer
+
+
+def _flush_writers() -> None:
+    """Write any pending saves before the interpreter exits"""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.flush()
+
+
+@cache
 def _default_save_directory() -> str:
     return str(Path.home() / "Pictures" / "scope_capture")
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
-    """Configuration manager for the application"""
+    """Configuration manager for the application
+
+    Change settings with update() so mutual exclusivity and auto-save apply;
+    plain attribute assignment only changes the in-memory value.
+    """
 
     # Persisted config fields
     save_directory: str = field(default_factory=_default_save_directory)
@@ -42,96 +214,169 @@ class AppConfig:
     # Non-persisted fields (excluded from JSON)
     _config_file: Path = field(default=None, repr=False, compare=False)
     _app_data_dir: Path = field(default=None, repr=False, compare=False)
-    _loading: bool = field(default=True, repr=False, compare=False)
+    _loaded: bool = field(default=False, repr=False, compare=False)
+    _defaults: dict = field(default=None, repr=False, compare=False)
     _logger: logging.Logger = field(default=None, repr=False, compare=False)
+    _cached_fmt: tuple = field(default=('', ''), repr=False, compare=False)
 
     def __post_init__(self):
-        """Initialize paths and load existing config"""
-        object.__setattr__(self, '_app_data_dir', Path.home() / ".simple_scope")
+        """Initialize paths; the config file is loaded on first field access"""
+        self._app_data_dir = _APP_DATA_DIR
 
         if self._config_file is None:
-            object.__setattr__(self, '_config_file', self._app_data_dir / "config.json")
+            self._config_file = _DEFAULT_CONFIG_FILE
+
+        # Stash constructor values and clear the slots, so the first read of a
+        # persisted field falls through to __getattr__ and loads the file
+        self._defaults = {name: getattr(self, name) for name in _PUBLIC_FIELDS}
+        for name in _PUBLIC_FIELDS:
+            delattr(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Only called for unset slots: load the config file on first access"""
+        if name in _PUBLIC_FIELD_SET and not self._loaded:
+            self._ensure_loaded()
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _ensure_loaded(self) -> None:
+        """Load the config file once, keeping any fields assigned before the load"""
+        if self._loaded:
+            return
+        self._loaded = True
 
-        self._load_config()
-        object.__setattr__(self, '_loading', False)
+        assigned = set()
+        for name, value in self._defaults.items():
+            try:
+                object.__getattribute__(self, name)
+                assigned.add(name)
+            except AttributeError:
+                setattr(self, name, value)
+        self._load_config(skip=assigned)
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Custom setattr to handle auto-save and mutual exclusivity"""
-        # Use object.__setattr__ for private fields to avoid recursion
-        if name.startswith('_'):
-            object.__setattr__(self, name, value)
-            return
+    def update(self, **kwargs: Any) -> None:
+        """Set one or more config fields and schedule a single save.
+
+        Handles auto_increment/datestamp mutual exclusivity. Assigning an
+        unchanged scalar does not trigger a save.
+
+        Raises:
+            ValueError: If a keyword is not a persisted config field
+        """
+        self._ensure_loaded()
+        changed = False
+        for name, value in kwargs.items():
+            if name not in _PUBLIC_FIELD_SET:
+                raise ValueError(f"Unknown config field: {name}")
 
-        # Handle mutual exclusivity for auto_increment/datestamp
-        if name == 'auto_increment' and value:
-            object.__setattr__(self, 'datestamp', False)
-        elif name == 'datestamp' and value:
-            object.__setattr__(self, 'auto_increment', False)
+            # dicts/lists are always saved since they may have been mutated in place
+            if not isinstance(value, (dict, list)) and getattr(self, name) == value:
+                continue
 
-        # Set the value
-        object.__setattr__(self, name, value)
+            # Handle mutual exclusivity for auto_increment/datestamp
+            if name == 'auto_increment' and value:
+                self.datestamp = False
+            elif name == 'datestamp' and value:
+                self.auto_increment = False
 
-        # Auto-save (skip during loading)
-        if not getattr(self, '_loading', True):
-            self.save_config()
+            setattr(self, name, value)
+            changed = True
 
-    def _log(self, level: str, message: str) -> None:
-        """Log a message using the module logger.
+        if changed:
+            self._schedule_save()
+
+    @property
+    def _writer(self) -> _ConfigWriter:
+        """Background writer shared by all configs using this file"""
+        return _writer_for(self._config_file)
+
+    def _schedule_save(self) -> None:
+        """Hand the serialized settings to the background writer"""
+        # Serialized here rather than on the writer thread: the snapshot's nested
+        # dicts/lists are the caller's live objects and may change before the write
+        try:
+            payload = _dumps(self._snapshot())
+        except Exception as e:
+            logger.error(f"Error saving configuration: {str(e)}")
+            return
+        self._writer.enqueue(payload, None)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Write pending changes now and wait for the write (call on shutdown)
 
         Args:
-            level: Log level ('debug', 'info', 'warning', 'error')
-            message: Message to log
+            timeout: Maximum seconds to wait for the background writer
         """
-        getattr(logger, level)(message)
+        writer = self._writer
+        if writer.started:
+            try:
+                payload = _dumps(self._snapshot())
+            except Exception as e:
+                logger.error(f"Error saving configuration: {str(e)}")
+                payload = None  # still wait for whatever is pending
+            writer.flush(payload, timeout)
 
     @property
     def formatted_file_format(self) -> str:
         """File format with dot prefix (.png, .jpg)"""
+        # (file_format, formatted) pair; only rebuilt when file_format changes
+        raw, formatted = self._cached_fmt
         fmt = self.file_format
-        return fmt if fmt.startswith('.') else f'.{fmt}'
+        if fmt != raw:
+            formatted = fmt if fmt.startswith('.') else f'.{fmt}'
+            self._cached_fmt = (fmt, formatted)
+        return formatted
 
     @property
     def default_save_directory(self) -> str:
         """Get the default save directory path"""
         return _default_save_directory()
 
-    def _load_config(self) -> None:
-        """Load configuration from file"""
+    def _load_config(self, skip: set = frozenset()) -> None:
+        """Load configuration from file
+
+        Args:
+            skip: Field names to leave untouched (already assigned in memory)
+        """
         try:
             if self._config_file.exists():
-                logger.debug(f"Loading config from: {self._config_file}")
-                with open(self._config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Update fields with loaded values
-                    for key, value in loaded_config.items():
-                        if hasattr(self, key) and not key.startswith('_'):
-                            object.__setattr__(self, key, value)
-                logger.debug(f"Config loaded successfully, {len(loaded_config)} keys")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Loading config from: {self._config_file}")
+                raw = self._config_file.read_bytes()
+                loaded_config = _loads(raw)
+                # Update fields with loaded values
+                for key, value in loaded_config.items():
+                    if key in _PUBLIC_FIELD_SET:
+                        if key not in skip:
+                            setattr(self, key, value)
+                    elif key != 'app_version':
+                        logger.debug(f"Ignoring unknown config key: {key}")
+                # Remember what is on disk so an unchanged save can be skipped
+                self._writer.last_written_bytes = raw
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Config loaded successfully, {len(loaded_config)} keys")
             else:
-                logger.debug(f"No existing config file at: {self._config_file}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"No existing config file at: {self._config_file}")
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
 
-    def save_config(self) -> None:
-        """Save configuration to file"""
-        try:
-            # Ensure directory exists
-            self._config_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Filter out private fields for JSON serialization
-            config_dict = {
-                k: v for k, v in asdict(self).items()
-                if not k.startswith('_')
-            }
-
-            # Always log the current application version
-            config_dict['app_version'] = __version__
+    def _snapshot(self) -> dict:
+        """Shallow copy of the persisted settings, plus the app version"""
+        config_dict = {name: getattr(self, name) for name in _PUBLIC_FIELDS}
 
-            with open(self._config_file, 'w') as f:
-                json.dump(config_dict, f, indent=4)
+        # Always log the current application version
+        config_dict['app_version'] = __version__
+        return config_dict
 
-            logger.debug(f"Config saved to: {self._config_file}")
+    def save_config(self, durable: bool = False) -> None:
+        """Save configuration to file (synchronously, on the calling thread)
 
+        Args:
+            durable: fsync before replacing the file
+        """
+        try:
+            self._writer.write(_dumps(self._snapshot()), durable)
         except Exception as e:
             logger.error(f"Error saving configuration: {str(e)}")
 
@@ -149,17 +394,30 @@ class AppConfig:
 
     def set_save_directory(self, directory: str) -> None:
         """Set the save directory and update recent directories list"""
-        # Add to recent directories if not already present
-        if directory not in self.recent_directories:
-            self.recent_directories.insert(0, str(directory))
-            # Keep only the most recent 5 directories
-            object.__setattr__(self, 'recent_directories', self.recent_directories[:5])
+        directory = os.fspath(directory)
+        if directory != self.save_directory:
+            # Files may have changed there since its counters were cached. Not on every
+            # call: capture() re-sets the same directory after each shot
+            invalidate_filename_cache(directory)
+        elif self.recent_directories[:1] == [directory]:
+            return
 
-        self.save_directory = str(directory)
+        # Move (or add) the directory to the front, keeping the most recent few
+        recent = deque(self.recent_directories[:MAX_RECENT_DIRECTORIES], maxlen=MAX_RECENT_DIRECTORIES)
+        if directory in recent:
+            recent.remove(directory)
+        recent.appendleft(directory)
+
+        self.update(recent_directories=list(recent), save_directory=directory)
 
     def get_filename_with_suffix(self, filename: str = '') -> str:
         """Get filename with the configured file format suffix"""
         fmt = self.formatted_file_format
-        if not filename.endswith(fmt):
-            filename += fmt
-        return filename
+        return filename if filename.endswith(fmt) else filename + fmt
+
+
+# Persisted field names, computed once instead of filtering fields() on every save
+_PUBLIC_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(AppConfig) if not f.name.startswith('_')
+)
+_PUBLIC_FIELD_SET: frozenset[str] = frozenset(_PUBLIC_FIELDS)
@@ -1,14 +1,40 @@
 """
 GUI implementation for the Oscilloscope Screenshot Capture Application
 """
+import os
+import queue
+import threading
 import time
-from pathlib import Path
+from functools import lru_cache
+from pathlib import PurePath
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
-import webbrowser
 from app.simple_scope import SimpleScope
-from app.utils import get_resource_path
+from app.utils import get_resource_path, invalidate_filename_cache
+
+# Scope auto-scan retries with exponential backoff starting at SCAN_BACKOFF_SECONDS
+SCAN_ATTEMPTS = 5
+SCAN_BACKOFF_SECONDS = 0.05
+
+# Most recent log lines kept in the Help-tab log view
+LOG_DISPLAY_MAX = 5000
+# Interval at which queued log records are moved into the log view
+LOG_POLL_MS = 100
+
+
+@lru_cache(maxsize=16)
+def _split_subdirs(default: str, current: str) -> tuple[str, tuple[str, ...]]:
+    """Split current into (default, subdirectory parts below default); pure string work, no syscalls"""
+    default_dir = PurePath(default)
+    try:
+        # Check if current is relative to default and split the relative path into parts
+        subdirs = PurePath(current).relative_to(default_dir).parts
+    except ValueError:
+        # current is not a subdirectory of default
+        subdirs = ()
+    return str(default_dir), subdirs
+
 
 class ScopeCaptureGUI(tk.Tk):
     """Main application window for the oscilloscope capture tool"""
@@ -43,6 +69,16 @@ class ScopeCaptureGUI(tk.Tk):
         self.photo_image = None
         self.image_display_frame = None
 
+        # Tcl command shared by all subdirectory row buttons; see _on_row_button
+        self._row_button_cmd = self.register(self._on_row_button)
+
+
+        # Worker threads started by _run_in_background, kept to refuse overlapping runs
+        self._scan_thread = None
+        self._capture_thread = None
+        self._log_save_thread = None
+        self._capture_buttons = []  # disabled while a capture runs
+
         self.notebook.add(self.capture_tab, text="Capture")
         self.notebook.add(self.config_tab, text="Config")
         self.notebook.add(self.scope_tab, text="Scope")
@@ -50,27 +86,55 @@ class ScopeCaptureGUI(tk.Tk):
         self.notebook.add(self.about_tab, text="About")
 
         # self.notebook.add(self.metadata_tab, text="Metadata")
-        # Initialize the tabs
-        self._initialize_scope_tab()
+        # Initialize the tabs; only Capture (shown first) is built now, the others
+        # on first selection. Tab path -> builder, removed once the tab is built.
+        self._initialize_scope_vars()
+        self._initialize_config_vars()
+        self._tab_initializers = {
+            str(self.scope_tab): self._initialize_scope_tab,
+            str(self.config_tab): self._initialize_config_tab,
+            str(self.help_tab): self._initialize_help_tab,
+            str(self.about_tab): self._initialize_about_tab,
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         self._initialize_capture_tab()
-        self._initialize_config_tab()
-        self._initialize_help_tab()
-        self._initialize_about_tab()
         # self._initialize_metadata_tab()
 
         # Update window size based on display image config
         self._update_window_size()
 
-        # Auto-scan for scope on startup
-        self.after(500, self.scan_for_scope)
+        # Auto-scan for scope once the window is up (runs in a worker thread)
+        self.after_idle(self.scan_for_scope)
+
+        # Write any pending config changes before the window closes
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_tab_changed(self, event=None):
+        """Build a tab's widgets the first time it is selected"""
+        initializer = self._tab_initializers.pop(self.notebook.select(), None)
+        if initializer is not None:
+            initializer()
+
+    def _on_close(self):
+        """Flush pending config changes and close the application"""
+        self.scope.config.flush()
+        self.destroy()
     
+    def _initialize_scope_vars(self):
+        """Create the Scope tab variables; scanning updates them even before the tab is built"""
+        self.connection_status_var = tk.StringVar(value="Status: Not Connected")
+        self.device_info_var = tk.StringVar(value="No device detected")
+        self.instrument_var = tk.StringVar()
+        self._instrument_map = {}  # Maps display string to instrument info
+        self._update_device_info_from_config()
+
     def _initialize_scope_tab(self):
         """Initialize the Scope tab with connection controls"""
         frame = ttk.Frame(self.scope_tab, padding=(20, 10))
         frame.pack(fill='both', expand=True)
 
         # Connection status
-        self.connection_status = ttk.Label(frame, text="Status: Not Connected")
+        self.connection_status = ttk.Label(frame, textvariable=self.connection_status_var)
         self.connection_status.pack(anchor='w', pady=(0, 10))
 
         # Separator
@@ -80,23 +144,23 @@ class ScopeCaptureGUI(tk.Tk):
         ttk.Label(frame, text="Discovered Instruments:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0, 5))
 
         # Dropdown for instrument selection
-        self.instrument_var = tk.StringVar()
         self.instrument_dropdown = ttk.Combobox(frame, textvariable=self.instrument_var,
                                                  state="readonly", width=60)
         self.instrument_dropdown.pack(anchor='w', pady=(0, 10))
         self.instrument_dropdown.bind('<<ComboboxSelected>>', self._on_instrument_selected)
-        self._instrument_map = {}  # Maps display string to instrument info
 
         # Scan button
-        scan_button = ttk.Button(frame, text="Scan for Scope", command=self.scan_for_scope)
+        scan_button = ttk.Button(frame, text="Scan for Scope", command=lambda: self.scan_for_scope(refresh=True))
         scan_button.pack(anchor='w')
 
         # Device info (currently connected) - initialized from config's last_connected_scope
         ttk.Separator(frame, orient='horizontal').pack(fill='x', pady=15)
         ttk.Label(frame, text="Currently Connected:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0, 2))
-        self.device_info = ttk.Label(frame, text="No device detected")
+        self.device_info = ttk.Label(frame, textvariable=self.device_info_var)
         self.device_info.pack(anchor='w', padx=(20, 0))
-        self._update_device_info_from_config()
+
+        # Populate from any scan that finished before the tab was first shown
+        self._update_instrument_dropdown()
     
     def _initialize_capture_tab(self):
         """Initialize the Capture tab with layout selector and capture controls"""
@@ -108,17 +172,17 @@ class ScopeCaptureGUI(tk.Tk):
 
         basic_btn = ttk.Radiobutton(layout_frame, text="Basic",
                                     variable=self.layout_mode_var, value="Basic",
-                                    command=self._redraw_capture_content)
+                                    command=self._schedule_redraw)
         basic_btn.pack(side='left', padx=(0, 10))
 
         engineering_btn = ttk.Radiobutton(layout_frame, text="Engineering",
                                           variable=self.layout_mode_var, value="Engineering",
-                                          command=self._redraw_capture_content)
+                                          command=self._schedule_redraw)
         engineering_btn.pack(side='left', padx=(0, 10))
 
         advanced_btn = ttk.Radiobutton(layout_frame, text="Advanced",
                                        variable=self.layout_mode_var, value="Advanced",
-                                       command=self._redraw_capture_content)
+                                       command=self._schedule_redraw)
         advanced_btn.pack(side='left')
 
         # Separator
@@ -128,46 +192,117 @@ class ScopeCaptureGUI(tk.Tk):
         self.capture_content_frame = ttk.Frame(self.capture_tab)
         self.capture_content_frame.pack(fill='both', expand=True)
 
+        # Layouts are built on first use and then shown/hidden rather than rebuilt;
+        # per-layout widget references are swapped in when a layout is shown
+        self._layout_frames = {}
+        self._layout_widgets = {}
+        self._layout_save_dirs = {}  # layout -> _cfg_save_dir its subdirectory rows were filled from
+        self._subdir_row_pool = []  # removed subdirectory rows, hidden for reuse
+        self._shown_layout = None
+        self._redraw_job = None
+
         # Initialize variables used by capture
-        self.save_dir_var = tk.StringVar(value=self.scope.config.get_save_directory())
-        self.filename_var = tk.StringVar(value=self.scope.config.default_filename)
+        self._refresh_config_snapshot()
+        self.save_dir_var = tk.StringVar(value=self._cfg_save_dir)
+        self.filename_var = tk.StringVar(value=self._cfg_default_filename)
+        # A new target name/directory may have files deleted since its counter was cached
+        for var in (self.save_dir_var, self.filename_var):
+            var.trace_add('write', lambda *args: invalidate_filename_cache())
 
         # Draw initial content
         self._redraw_capture_content()
 
-    def _redraw_capture_content(self):
-        """Redraw the capture tab content based on selected layout"""
-        # Clear existing content
-        for widget in self.capture_content_frame.winfo_children():
-            widget.destroy()
+    def _schedule_redraw(self):
+        """Layout radio callback: coalesce rapid toggles into a single redraw"""
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+        self._redraw_job = self.after(30, self._redraw_capture_content)
 
+    def _refresh_config_snapshot(self):
+        """Cache the config paths used while drawing layouts.
+
+        Refreshed at startup and whenever the save directory may have changed
+        (browse, capture), so redraws don't query the config each time.
+        """
+        self._cfg_default_dir = self.scope.config.get_default_save_directory()
+        self._cfg_save_dir = self.scope.config.get_save_directory()
+        self._cfg_default_filename = self.scope.config.default_filename
+
+    def _redraw_capture_content(self):
+        """Show the capture tab content for the selected layout, building it on first use"""
+        self._redraw_job = None
         layout = self.layout_mode_var.get()
+        if layout == self._shown_layout:
+            return
+
+        # Only the currently shown layout is packed
+        shown_frame = self._layout_frames.get(self._shown_layout)
+        if shown_frame is not None:
+            shown_frame.pack_forget()
+        self._shown_layout = layout
+
+        frame = self._layout_frames.get(layout)
+        if (frame is not None and layout != "Basic"
+                and self._layout_save_dirs.get(layout) != self._cfg_save_dir):
+            # Its subdirectory rows came from an older save directory (browse or a
+            # capture elsewhere since); rebuild them from the current one
+            self._drop_capture_layout(layout)
+            frame = None
+
+        if frame is None:
+            # Each layout sets these while drawing; start clean so they aren't shared
+            self.subdir_rows_frame = None
+            self.subdir_rows = {}
+            self.captured_image_label = None
+
+            if layout == "Basic":
+                frame = self._draw_basic_layout()
+            elif layout == "Engineering":
+                frame = self._draw_engineering_layout()
+            else:
+                frame = self._draw_advanced_layout()
 
-        if layout == "Basic":
-            self._draw_basic_layout()
-        elif layout == "Engineering":
-            self._draw_engineering_layout()
+            self._layout_frames[layout] = frame
+            self._layout_widgets[layout] = (self.subdir_rows_frame, self.subdir_rows, self.captured_image_label)
+            self._layout_save_dirs[layout] = self._cfg_save_dir
         else:
-            self._draw_advanced_layout()
+            frame.pack(fill='both', expand=True)
+            self.subdir_rows_frame, self.subdir_rows, self.captured_image_label = self._layout_widgets[layout]
+            if layout != "Basic":
+                # Engineering/Advanced edit subdirectories relative to the default directory
+                default_dir, _ = self._get_subdirectory_parts()
+                if self.save_dir_var.get() != default_dir:
+                    self.save_dir_var.set(default_dir)
+
+    def _invalidate_capture_layouts(self):
+        """Destroy the cached layouts so they are rebuilt (e.g. after display settings change)"""
+        for layout_frame in self._layout_frames.values():
+            layout_frame.destroy()
+        self._layout_frames.clear()
+        self._layout_widgets.clear()
+        self._layout_save_dirs.clear()
+        self._capture_buttons.clear()
+        self._subdir_row_pool.clear()
+        self._shown_layout = None
+
+    def _drop_capture_layout(self, layout):
+        """Destroy one cached layout, and the buttons and pooled rows that belong to it"""
+        frame = self._layout_frames.pop(layout)
+        del self._layout_widgets[layout]
+        self._layout_save_dirs.pop(layout, None)
+        inside = str(frame) + '.'
+        self._capture_buttons[:] = [button for button in self._capture_buttons
+                                    if not str(button).startswith(inside)]
+        self._subdir_row_pool[:] = [row_data for row_data in self._subdir_row_pool
+                                    if not str(row_data['frame']).startswith(inside)]
+        frame.destroy()
 
     def _get_subdirectory_parts(self):
         """
         Split the save_directory into default_save_directory and subdirectory parts.
-        Returns a tuple of (default_dir, list of subdirectory parts)
+        Returns a tuple of (default_dir, tuple of subdirectory parts)
         """
-        default_dir = Path(self.scope.config.get_default_save_directory())
-        current_dir = Path(self.scope.config.get_save_directory())
-
-        try:
-            # Check if current_dir is relative to default_dir
-            relative_path = current_dir.relative_to(default_dir)
-            # Split the relative path into parts
-            subdirs = list(relative_path.parts)
-        except ValueError:
-            # current_dir is not a subdirectory of default_dir
-            subdirs = []
-
-        return str(default_dir), subdirs
+        return _split_subdirs(self._cfg_default_dir, self._cfg_save_dir)
 
     def _draw_basic_layout(self):
         """Draw the Basic layout for capture tab"""
@@ -194,6 +329,7 @@ class ScopeCaptureGUI(tk.Tk):
 
         capture_button = ttk.Button(button_frame, text="Capture", command=self.capture_screenshot)
         capture_button.pack(side='left', padx=(0, 10))
+        self._capture_buttons.append(capture_button)
 
         copy_clipboard_btn = ttk.Button(button_frame, text="Copy to Clipboard",
                                         command=self._copy_recent_to_clipboard)
@@ -204,6 +340,8 @@ class ScopeCaptureGUI(tk.Tk):
         if display_mode != "Disabled":
             self._create_image_display_area(frame, display_mode)
 
+        return frame
+
     def _draw_engineering_layout(self):
         """Draw the Engineering layout for capture tab with labeled subdirectory rows"""
         frame = ttk.Frame(self.capture_content_frame, padding=(20, 10))
@@ -218,7 +356,8 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Save Directory - use default_save_directory
         ttk.Label(frame, text="Save Directory:").grid(row=1, column=0, sticky='w', pady=5)
-        self.save_dir_var.set(default_dir)
+        if self.save_dir_var.get() != default_dir:
+            self.save_dir_var.set(default_dir)
         save_dir_entry = ttk.Entry(frame, textvariable=self.save_dir_var, width=60)
         save_dir_entry.grid(row=1, column=1, columnspan=3, sticky='ew', pady=5, padx=(5, 0))
 
@@ -231,8 +370,8 @@ class ScopeCaptureGUI(tk.Tk):
         self.subdir_rows_frame = ttk.Frame(frame)
         self.subdir_rows_frame.grid(row=4, column=0, columnspan=4, sticky='ew', pady=5)
 
-        # Initialize subdirectory rows list
-        self.subdir_rows = []
+        # Subdirectory rows keyed by their row frame's Tk path, in display order
+        self.subdir_rows = {}
 
         # Add labeled rows with values from subdirectory parts if available
         ic_part_value = subdir_parts[0] if len(subdir_parts) > 0 else "Unknown"
@@ -251,8 +390,9 @@ class ScopeCaptureGUI(tk.Tk):
         button_frame = ttk.Frame(frame)
         button_frame.grid(row=7, column=0, columnspan=4, sticky='w', pady=10)
 
-        capture_button = ttk.Button(button_frame, text="Capture", command=self._capture_engineering)
+        capture_button = ttk.Button(button_frame, text="Capture", command=self._capture_with_subdirectories)
         capture_button.pack(side='left', padx=(0, 10))
+        self._capture_buttons.append(capture_button)
 
         copy_clipboard_btn = ttk.Button(button_frame, text="Copy to Clipboard",
                                         command=self._copy_recent_to_clipboard)
@@ -263,19 +403,20 @@ class ScopeCaptureGUI(tk.Tk):
         if display_mode != "Disabled":
             self._create_image_display_area(frame, display_mode)
 
+        return frame
+
     def _add_labeled_subdir_row(self, label, default_value=""):
         """Add a labeled subdirectory row with a default value"""
         row_frame = ttk.Frame(self.subdir_rows_frame)
         row_frame.pack(fill='x', pady=2)
 
         row_data = {'frame': row_frame, 'entries': [], 'entry_widgets': [], 'label': label}
-        row_index = len(self.subdir_rows)
 
         # Add label
         ttk.Label(row_frame, text=label, width=15).pack(side='left', padx=(0, 5))
 
         # Add first text box with default value
-        entry_var = tk.StringVar(value=default_value)
+        entry_var = self._new_subdir_var(default_value)
         entry = ttk.Entry(row_frame, textvariable=entry_var, width=20)
         entry.pack(side='left', padx=(0, 5))
         row_data['entries'].append(entry_var)
@@ -283,51 +424,17 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Add field button
         add_field_btn = ttk.Button(row_frame, text="+", width=3,
-                                   command=lambda idx=row_index: self._add_field_to_row(idx))
+                                   command=(self._row_button_cmd, 'add_field', str(row_frame)))
         add_field_btn.pack(side='left', padx=(0, 5))
         row_data['add_btn'] = add_field_btn
 
         # Remove field button
         remove_field_btn = ttk.Button(row_frame, text="-", width=3,
-                                      command=lambda idx=row_index: self._remove_field_from_row(idx))
+                                      command=(self._row_button_cmd, 'remove_field', str(row_frame)))
         remove_field_btn.pack(side='left', padx=(0, 5))
         row_data['remove_btn'] = remove_field_btn
 
-        self.subdir_rows.append(row_data)
-
-    def _capture_engineering(self):
-        """Capture screenshot with engineering subdirectory support"""
-        if not self.scope.is_connected():
-            messagebox.showwarning("Not Connected", "No oscilloscope connected. Please scan for devices first.")
-            return
-
-        try:
-            base_save_dir = Path(self.save_dir_var.get())
-            subdir_path = self._get_subdirectory_path()
-            save_dir = base_save_dir / subdir_path
-
-            # Create subdirectory if it doesn't exist
-            save_dir.mkdir(parents=True, exist_ok=True)
-
-            base_filename = self.filename_var.get()
-            suffix = self.file_format_var.get()
-
-            # Get filename using SimpleScope API (handles auto_increment/datestamp)
-            filename_ = self.scope.get_capture_filename(str(save_dir), base_filename, suffix)
-
-            screenshot_data = self.scope.capture(save_dir=str(save_dir),
-                               filename=Path(filename_).stem,
-                               suffix=suffix,
-                               bg_color=self.bg_color_var.get(),
-                               save_waveform=self.save_waveform_var.get(),
-                               metadata={key: var.get() for key, (_, var) in self.metadata_fields.items()}
-                               )
-
-            # Display captured image if enabled
-            self._display_captured_image(screenshot_data)
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to capture screenshot: {str(e)}")
+        self.subdir_rows[str(row_frame)] = row_data
 
     def _draw_advanced_layout(self):
         """Draw the Advanced layout for capture tab with subdirectory support"""
@@ -343,7 +450,8 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Save Directory - use default_save_directory
         ttk.Label(frame, text="Save Directory:").grid(row=1, column=0, sticky='w', pady=5)
-        self.save_dir_var.set(default_dir)
+        if self.save_dir_var.get() != default_dir:
+            self.save_dir_var.set(default_dir)
         save_dir_entry = ttk.Entry(frame, textvariable=self.save_dir_var, width=60)
         save_dir_entry.grid(row=1, column=1, columnspan=3, sticky='ew', pady=5, padx=(5, 0))
 
@@ -362,8 +470,8 @@ class ScopeCaptureGUI(tk.Tk):
         self.subdir_rows_frame = ttk.Frame(frame)
         self.subdir_rows_frame.grid(row=4, column=0, columnspan=4, sticky='ew', pady=5)
 
-        # Initialize subdirectory rows list
-        self.subdir_rows = []
+        # Subdirectory rows keyed by their row frame's Tk path, in display order
+        self.subdir_rows = {}
 
         # Pre-populate with existing subdirectory parts
         for subdir_part in subdir_parts:
@@ -380,8 +488,9 @@ class ScopeCaptureGUI(tk.Tk):
         button_frame = ttk.Frame(frame)
         button_frame.grid(row=7, column=0, columnspan=4, sticky='w', pady=10)
 
-        capture_button = ttk.Button(button_frame, text="Capture", command=self._capture_advanced)
+        capture_button = ttk.Button(button_frame, text="Capture", command=self._capture_with_subdirectories)
         capture_button.pack(side='left', padx=(0, 10))
+        self._capture_buttons.append(capture_button)
 
         copy_clipboard_btn = ttk.Button(button_frame, text="Copy to Clipboard",
                                         command=self._copy_recent_to_clipboard)
@@ -392,16 +501,26 @@ class ScopeCaptureGUI(tk.Tk):
         if display_mode != "Disabled":
             self._create_image_display_area(frame, display_mode)
 
+        return frame
+
     def _add_subdirectory_row(self, default_value=""):
-        """Add a new subdirectory row with text boxes"""
+        """Add a new subdirectory row with text boxes, reusing a removed row if one is pooled"""
+        parent = str(self.subdir_rows_frame)
+        for pool_index, pooled in enumerate(self._subdir_row_pool):
+            if str(pooled['frame'].master) == parent:
+                row_data = self._subdir_row_pool.pop(pool_index)
+                row_data['entries'][0].set(default_value)
+                row_data['frame'].pack(fill='x', pady=2)
+                self.subdir_rows[str(row_data['frame'])] = row_data
+                return
+
         row_frame = ttk.Frame(self.subdir_rows_frame)
         row_frame.pack(fill='x', pady=2)
 
         row_data = {'frame': row_frame, 'entries': [], 'entry_widgets': []}
-        row_index = len(self.subdir_rows)
 
         # Add first text box
-        entry_var = tk.StringVar(value=default_value)
+        entry_var = self._new_subdir_var(default_value)
         entry = ttk.Entry(row_frame, textvariable=entry_var, width=20)
         entry.pack(side='left', padx=(0, 5))
         row_data['entries'].append(entry_var)
@@ -409,38 +528,52 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Add field button
         add_field_btn = ttk.Button(row_frame, text="+", width=3,
-                                   command=lambda idx=row_index: self._add_field_to_row(idx))
+                                   command=(self._row_button_cmd, 'add_field', str(row_frame)))
         add_field_btn.pack(side='left', padx=(0, 5))
         row_data['add_btn'] = add_field_btn
 
         # Remove field button
         remove_field_btn = ttk.Button(row_frame, text="-", width=3,
-                                      command=lambda idx=row_index: self._remove_field_from_row(idx))
+                                      command=(self._row_button_cmd, 'remove_field', str(row_frame)))
         remove_field_btn.pack(side='left', padx=(0, 5))
         row_data['remove_field_btn'] = remove_field_btn
 
         # Remove row button
         remove_row_btn = ttk.Button(row_frame, text="X", width=3,
-                                    command=lambda idx=row_index: self._remove_subdirectory_row(idx))
+                                    command=(self._row_button_cmd, 'remove_row', str(row_frame)))
         remove_row_btn.pack(side='left', padx=(5, 0))
         row_data['remove_row_btn'] = remove_row_btn
 
-        self.subdir_rows.append(row_data)
+        self.subdir_rows[str(row_frame)] = row_data
+
+    def _on_row_button(self, action, frame_path):
+        """Single dispatcher for the subdirectory row buttons.
+
+        Buttons pass their row frame's Tk path, which is also the row's key in
+        subdir_rows, so commands stay valid when other rows are removed and no
+        per-row closures are needed.
+        """
+        if action == 'add_field':
+            self._add_field_to_row(frame_path)
+        elif action == 'remove_field':
+            self._remove_field_from_row(frame_path)
+        elif action == 'remove_row':
+            self._remove_subdirectory_row(frame_path)
 
     def _add_subdirectory_row_with_value(self, value):
         """Add a new subdirectory row pre-populated with a value"""
         self._add_subdirectory_row(default_value=value)
 
-    def _add_field_to_row(self, row_index):
+    def _add_field_to_row(self, row_key):
         """Add another text box to a subdirectory row"""
-        if row_index >= len(self.subdir_rows):
+        row_data = self.subdir_rows.get(row_key)
+        if row_data is None:
             return
 
-        row_data = self.subdir_rows[row_index]
         row_frame = row_data['frame']
 
         # Create new entry
-        entry_var = tk.StringVar()
+        entry_var = self._new_subdir_var()
         entry = ttk.Entry(row_frame, textvariable=entry_var, width=20)
 
         # Insert before the add button
@@ -448,17 +581,12 @@ class ScopeCaptureGUI(tk.Tk):
         row_data['entries'].append(entry_var)
         row_data['entry_widgets'].append(entry)
 
-    def _remove_field_from_row(self, row_index):
+    def _remove_field_from_row(self, row_key):
         """Remove the last text box from a subdirectory row"""
-        if row_index >= len(self.subdir_rows):
-            return
-
-        row_data = self.subdir_rows[row_index]
-        if row_data is None:
-            return
+        row_data = self.subdir_rows.get(row_key)
 
         # Keep at least one entry
-        if len(row_data['entries']) <= 1:
+        if row_data is None or len(row_data['entries']) <= 1:
             return
 
         # Remove last entry widget and variable
@@ -466,61 +594,48 @@ class ScopeCaptureGUI(tk.Tk):
         last_entry.destroy()
         row_data['entries'].pop()
 
-    def _remove_subdirectory_row(self, row_index):
-        """Remove a subdirectory row"""
-        if row_index >= len(self.subdir_rows):
+    def _remove_subdirectory_row(self, row_key):
+        """Remove a subdirectory row, keeping its widgets for the next added row"""
+        row_data = self.subdir_rows.pop(row_key, None)
+        if row_data is None:
             return
 
-        row_data = self.subdir_rows[row_index]
-        row_data['frame'].destroy()
-        self.subdir_rows[row_index] = None  # Mark as removed
+        # Reset to a single empty entry and hide the row
+        while len(row_data['entries']) > 1:
+            row_data['entry_widgets'].pop().destroy()
+            row_data['entries'].pop()
+        row_data['entries'][0].set("")
+        row_data['frame'].pack_forget()
+        self._subdir_row_pool.append(row_data)
+
+    def _new_subdir_var(self, value=""):
+        """StringVar for a subdirectory entry; edits drop cached filename counters"""
+        var = tk.StringVar(value=value)
+        var.trace_add('write', lambda *args: invalidate_filename_cache())
+        return var
 
     def _get_subdirectory_path(self):
         """Build subdirectory path from all rows"""
+        # Concatenate entries in each row with '_', skipping empty entries and rows
         subdirs = []
-        for row_data in self.subdir_rows:
-            if row_data is None:
-                continue
-            # Concatenate entries in this row with '_'
-            parts = [var.get() for var in row_data['entries'] if var.get().strip()]
-            if parts:
-                subdirs.append('_'.join(parts))
-
-        return Path(*subdirs) if subdirs else Path()
-
-    def _capture_advanced(self):
-        """Capture screenshot with advanced subdirectory support"""
-        if not self.scope.is_connected():
-            messagebox.showwarning("Not Connected", "No oscilloscope connected. Please scan for devices first.")
-            return
+        for row_data in self.subdir_rows.values():
+            values = [var.get() for var in row_data['entries']]
+            subdir = '_'.join([value for value in values if value.strip()])
+            if subdir:
+                subdirs.append(subdir)
 
-        try:
-            base_save_dir = Path(self.save_dir_var.get())
-            subdir_path = self._get_subdirectory_path()
-            save_dir = base_save_dir / subdir_path
-
-            # Create subdirectory if it doesn't exist
-            save_dir.mkdir(parents=True, exist_ok=True)
-
-            base_filename = self.filename_var.get()
-            suffix = self.file_format_var.get()
-
-            # Get filename using SimpleScope API (handles auto_increment/datestamp)
-            filename_ = self.scope.get_capture_filename(str(save_dir), base_filename, suffix)
-
-            screenshot_data = self.scope.capture(save_dir=str(save_dir),
-                               filename=Path(filename_).stem,
-                               suffix=suffix,
-                               bg_color=self.bg_color_var.get(),
-                               save_waveform=self.save_waveform_var.get(),
-                               metadata={key: var.get() for key, (_, var) in self.metadata_fields.items()}
-                               )
+        return os.path.join(*subdirs) if subdirs else ""
 
-            # Display captured image if enabled
-            self._display_captured_image(screenshot_data)
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to capture screenshot: {str(e)}")
+    def _initialize_config_vars(self):
+        """Create the Config tab variables; capture reads them even before the tab is built"""
+        self.file_format_var = tk.StringVar(value="png")
+        self.bg_color_var = tk.StringVar(value="white")
+        self.save_waveform_var = tk.BooleanVar(value=False)
+        self.auto_increment_var = tk.BooleanVar(value=self.scope.config.auto_increment)
+        self.datestamp_var = tk.BooleanVar(value=self.scope.config.datestamp)
+        self.display_image_var = tk.StringVar(value=self.scope.config.display_captured_image)
+        self.display_image_size_var = tk.StringVar(value=self.scope.config.display_image_size)
+        self.auto_copy_var = tk.BooleanVar(value=self.scope.config.auto_copy_to_clipboard)
 
     def _initialize_config_tab(self):
         """Initialize the Config tab with file format, background, and waveform settings"""
@@ -529,36 +644,29 @@ class ScopeCaptureGUI(tk.Tk):
 
         # File format
         ttk.Label(frame, text="File Format:").grid(row=0, column=0, sticky='w', pady=5)
-
-        self.file_format_var = tk.StringVar(value="png")
         file_format_combo = ttk.Combobox(frame, textvariable=self.file_format_var,
                                          values=["png"], state="readonly", width=10)
         file_format_combo.grid(row=0, column=1, sticky='w', pady=5, padx=(5, 0))
 
         # Background color
         ttk.Label(frame, text="Background:").grid(row=1, column=0, sticky='w', pady=5)
-
-        self.bg_color_var = tk.StringVar(value="white")
         bg_color_combo = ttk.Combobox(frame, textvariable=self.bg_color_var,
                                      values=["white", "black"], state="readonly", width=10)
         bg_color_combo.grid(row=1, column=1, sticky='w', pady=5, padx=(5, 0))
 
         # Save waveform data
-        self.save_waveform_var = tk.BooleanVar(value=False)
         save_waveform_check = ttk.Checkbutton(frame, text="Save waveform data",
                                              variable=self.save_waveform_var,
                                              command=self._on_save_waveform_changed)
         save_waveform_check.grid(row=2, column=0, columnspan=2, sticky='w', pady=10)
 
         # Auto increment filename
-        self.auto_increment_var = tk.BooleanVar(value=self.scope.config.auto_increment)
         self.auto_increment_check = ttk.Checkbutton(frame, text="Auto increment filename",
                                                     variable=self.auto_increment_var,
                                                     command=self._on_auto_increment_changed)
         self.auto_increment_check.grid(row=3, column=0, columnspan=2, sticky='w', pady=5)
 
         # Datestamp filename
-        self.datestamp_var = tk.BooleanVar(value=self.scope.config.datestamp)
         self.datestamp_check = ttk.Checkbutton(frame, text="Append datestamp to filename",
                                                variable=self.datestamp_var,
                                                command=self._on_datestamp_changed)
@@ -566,7 +674,6 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Display Captured Image
         ttk.Label(frame, text="Display Captured Image:").grid(row=5, column=0, sticky='w', pady=5)
-        self.display_image_var = tk.StringVar(value=self.scope.config.display_captured_image)
         display_image_combo = ttk.Combobox(frame, textvariable=self.display_image_var,
                                            values=["Disabled", "Display To The Right", "Display Below"],
                                            state="readonly", width=20)
@@ -575,7 +682,6 @@ class ScopeCaptureGUI(tk.Tk):
 
         # Display Image Size
         ttk.Label(frame, text="Display Image Size:").grid(row=6, column=0, sticky='w', pady=5)
-        self.display_image_size_var = tk.StringVar(value=self.scope.config.display_image_size)
         display_size_combo = ttk.Combobox(frame, textvariable=self.display_image_size_var,
                                           values=["Small", "Medium", "Large"],
                                           state="readonly", width=10)
@@ -583,7 +689,6 @@ class ScopeCaptureGUI(tk.Tk):
         display_size_combo.bind('<<ComboboxSelected>>', self._on_display_image_size_changed)
 
         # Auto copy to clipboard
-        self.auto_copy_var = tk.BooleanVar(value=self.scope.config.auto_copy_to_clipboard)
         auto_copy_check = ttk.Checkbutton(frame, text="Auto copy to clipboard after capture",
                                           variable=self.auto_copy_var,
                                           command=self._on_auto_copy_changed)
@@ -599,27 +704,28 @@ class ScopeCaptureGUI(tk.Tk):
         """Handle auto increment checkbox change - mutually exclusive with datestamp"""
         if self.auto_increment_var.get():
             self.datestamp_var.set(False)
-        self.scope.config.auto_increment = self.auto_increment_var.get()
+        self.scope.config.update(auto_increment=self.auto_increment_var.get())
 
     def _on_datestamp_changed(self):
         """Handle datestamp checkbox change - mutually exclusive with auto increment"""
         if self.datestamp_var.get():
             self.auto_increment_var.set(False)
-        self.scope.config.datestamp = self.datestamp_var.get()
+        self.scope.config.update(datestamp=self.datestamp_var.get())
 
     def _on_display_image_changed(self, event=None):
         """Handle display image mode change"""
-        self.scope.config.display_captured_image = self.display_image_var.get()
+        self.scope.config.update(display_captured_image=self.display_image_var.get())
         self._update_window_size()
+        self._invalidate_capture_layouts()
         self._redraw_capture_content()
 
     def _on_display_image_size_changed(self, event=None):
         """Handle display image size change"""
-        self.scope.config.display_image_size = self.display_image_size_var.get()
+        self.scope.config.update(display_image_size=self.display_image_size_var.get())
 
     def _on_auto_copy_changed(self):
         """Handle auto copy checkbox change"""
-        self.scope.config.auto_copy_to_clipboard = self.auto_copy_var.get()
+        self.scope.config.update(auto_copy_to_clipboard=self.auto_copy_var.get())
 
     def _show_not_implemented(self, feature_name: str = "This feature"):
         """Show a generic 'not implemented' popup"""
@@ -634,8 +740,9 @@ class ScopeCaptureGUI(tk.Tk):
             new_geometry = "1050x400"
         else:  # Display Below
             new_geometry = "600x650"
+        # Applied with the next idle pass together with any relayout; forcing
+        # update_idletasks() here laid out the old widgets one extra time
         self.geometry(new_geometry)
-        self.update_idletasks()
 
     def _create_image_display_area(self, parent_frame, display_mode):
         """Create the image display area based on display mode"""
@@ -700,6 +807,7 @@ class ScopeCaptureGUI(tk.Tk):
         
         # This will be populated dynamically based on the metadata dict
         self.metadata_fields = {}
+        self._metadata_labels = {}
         self.metadata_frame = ttk.Frame(frame)
         self.metadata_frame.pack(fill='both', expand=True)
         
@@ -717,7 +825,8 @@ class ScopeCaptureGUI(tk.Tk):
         
         # Create new row
         row_idx = len(self.metadata_fields)
-        ttk.Label(self.metadata_frame, text=f"{key}:").grid(row=row_idx, column=0, sticky='w', pady=5)
+        label = ttk.Label(self.metadata_frame, text=f"{key}:")
+        label.grid(row=row_idx, column=0, sticky='w', pady=5)
         
         # Variable to store the value
         var = tk.StringVar(value=value)
@@ -726,16 +835,31 @@ class ScopeCaptureGUI(tk.Tk):
         
         # Store field references
         self.metadata_fields[key] = (entry, var)
+        self._metadata_labels[key] = label
+
+    def _collect_metadata(self):
+        """Metadata values keyed by field name"""
+        return {key: var.get() for key, (_, var) in self.metadata_fields.items()}
     
     def update_metadata_fields(self, metadata_dict):
-        """Update metadata fields based on the provided dictionary"""
-        # Clear existing fields
-        for widget in self.metadata_frame.winfo_children():
-            widget.destroy()
-        
-        self.metadata_fields = {}
-        
-        # Add fields from dictionary
+        """Update metadata fields based on the provided dictionary
+
+        Existing rows are reused: only rows for removed keys are destroyed and
+        only rows for new keys are created.
+        """
+        removed = self.metadata_fields.keys() - metadata_dict.keys()
+        for key in removed:
+            entry, _ = self.metadata_fields.pop(key)
+            entry.destroy()
+            self._metadata_labels.pop(key).destroy()
+
+        # Close the gaps left by removed rows
+        if removed:
+            for row_idx, (key, (entry, _)) in enumerate(self.metadata_fields.items()):
+                self._metadata_labels[key].grid_configure(row=row_idx)
+                entry.grid_configure(row=row_idx)
+
+        # Update common keys in place, append rows for new ones
         for key, value in metadata_dict.items():
             self.add_metadata_field(key, value)
     
@@ -750,9 +874,9 @@ class ScopeCaptureGUI(tk.Tk):
                 info_text = f"{model} (SN: {serial}) @ {addr}"
             else:
                 info_text = f"{model} @ {addr}"
-            self.device_info.config(text=info_text)
+            self.device_info_var.set(info_text)
         else:
-            self.device_info.config(text="No device detected")
+            self.device_info_var.set("No device detected")
 
     def _update_instrument_dropdown(self):
         """Update the instrument dropdown with discovered instruments"""
@@ -767,12 +891,60 @@ class ScopeCaptureGUI(tk.Tk):
             display_values.append(display_str)
             self._instrument_map[display_str] = instr
 
+        if str(self.scope_tab) in self._tab_initializers:
+            return  # the dropdown is filled when the tab is first built
+
         self.instrument_dropdown['values'] = display_values
         if display_values:
             self.instrument_dropdown.set('')  # Clear selection
 
+    @staticmethod
+    def _running(thread):
+        """Whether a background worker thread is still in progress"""
+        return thread is not None and thread.is_alive()
+
+    def _run_in_background(self, target, on_done, *args):
+        """Run target(*args) on a worker thread and report back on the Tk thread
+
+        Args:
+            target: Blocking function to run off the Tk thread
+            on_done: Called on the Tk thread as on_done(ok, result), where result
+                is target's return value or the exception it raised
+            *args: Arguments for target
+
+        Returns:
+            threading.Thread: The started worker thread
+        """
+        results = queue.Queue(maxsize=1)
+
+        def worker():
+            try:
+                results.put((True, target(*args)))
+            except Exception as e:
+                results.put((False, e))
+
+        def poll():
+            # Tk isn't thread-safe, so the worker never touches widgets; poll for its result
+            try:
+                ok, result = results.get_nowait()
+            except queue.Empty:
+                self.after(50, poll)
+                return
+            on_done(ok, result)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        self.after(50, poll)
+        return thread
+
     def _on_instrument_selected(self, event=None):
         """Handle instrument selection from dropdown"""
+        if self._running(self._capture_thread) or self._running(self._scan_thread):
+            # Reconnecting would replace the driver (and clear the scope's temp
+            # files) underneath the transfer
+            messagebox.showinfo("Busy", "Wait for the current capture or scan to finish.")
+            return
+
         selected = self.instrument_var.get()
         if not selected or selected not in self._instrument_map:
             return
@@ -789,77 +961,168 @@ class ScopeCaptureGUI(tk.Tk):
         # Connect to the selected scope
         result = self.scope.setup_scope(addr, driver)
         if result:
-            self.connection_status.config(text="Status: Connected")
+            self.connection_status_var.set("Status: Connected")
             device_info = self.scope.get_device_info()
-            self.device_info.config(text=f"{device_info}")
+            self.device_info_var.set(f"{device_info}")
         else:
-            self.connection_status.config(text="Status: Connection failed")
+            self.connection_status_var.set("Status: Connection failed")
             messagebox.showerror("Error", f"Failed to connect to scope at {addr}")
 
-    def scan_for_scope(self):
-        """Scan for connected oscilloscope"""
-        try:
-            for _ in range(5):
-                # First scan for all available instruments
-                self.scope.scan_for_instruments()
-
-                # Attempt to auto-connect to a supported scope
-                result = self.scope.auto_setup_scope()
-                if self.scope.scope is not None:
-                    break
-                time.sleep(0.5)
-
-            # Update the instrument dropdown with discovered instruments
-            self._update_instrument_dropdown()
-
-            if result:
-                self.connection_status.config(text="Status: Connected")
-                device_info = self.scope.get_device_info()
-                self.device_info.config(text=f"{device_info}")
-            else:
-                self.connection_status.config(text="Status: No supported scope found")
-                self.device_info.config(text="No device detected")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to scan for scope: {str(e)}")
-            self.connection_status.config(text="Status: Error")
-            self.device_info.config(text="Error during device scan")
+    def scan_for_scope(self, refresh=False):
+        """Scan for connected oscilloscope in a background thread
+
+        Args:
+            refresh (bool): Re-identify every instrument (manual Scan button)
+                instead of reusing identifications from earlier scans
+        """
+        if self._running(self._scan_thread):
+            return  # scan already in progress
+        if self._running(self._capture_thread):
+            # auto_setup_scope would replace the driver mid-transfer
+            messagebox.showinfo("Busy", "Wait for the current capture to finish before scanning.")
+            return
+
+        self.connection_status_var.set("Status: Scanning...")
+        self._scan_thread = self._run_in_background(self._scan_worker, self._on_scan_done, refresh)
+
+    def _scan_worker(self, refresh):
+        """Scan and auto-connect off the Tk thread
+
+        Returns:
+            The result of the last auto_setup_scope() attempt
+        """
+        result = None
+        for attempt in range(SCAN_ATTEMPTS):
+            # First scan for all available instruments; retries reuse the
+            # identifications the first attempt just made
+            self.scope.scan_for_instruments(refresh=refresh and attempt == 0)
+
+            # Attempt to auto-connect to a supported scope
+            result = self.scope.auto_setup_scope()
+            if self.scope.scope is not None:
+                break
+            if attempt < SCAN_ATTEMPTS - 1:
+                # Back off 50, 100, 200, 400 ms; no wait after the last attempt
+                time.sleep(SCAN_BACKOFF_SECONDS * (1 << attempt))
+        return result
+
+    def _on_scan_done(self, ok, result):
+        """Update the widgets with the scan outcome (Tk thread)"""
+        if not ok:
+            messagebox.showerror("Error", f"Failed to scan for scope: {str(result)}")
+            self.connection_status_var.set("Status: Error")
+            self.device_info_var.set("Error during device scan")
+            return
+
+        # Update the instrument dropdown with discovered instruments
+        self._update_instrument_dropdown()
+
+        if result:
+            self.connection_status_var.set("Status: Connected")
+            device_info = self.scope.get_device_info()
+            self.device_info_var.set(f"{device_info}")
+        else:
+            self.connection_status_var.set("Status: No supported scope found")
+            self.device_info_var.set("No device detected")
     
     def browse_directory(self):
-        """Open file browser to select save directory"""
-        directory = filedialog.askdirectory(initialdir=self.save_dir_var.get())
+        """Open file browser to select save directory
+
+        The dialog must run on the Tk thread, so it is dispatched from the idle
+        queue to let the button click finish redrawing first.
+        """
+        self.after_idle(self._ask_save_directory, self.save_dir_var.get())
+
+    def _ask_save_directory(self, initialdir):
+        """Show the directory dialog and apply the selection"""
+        from tkinter import filedialog  # only needed once the user browses
+
+        directory = filedialog.askdirectory(initialdir=initialdir)
         if directory:
             self.save_dir_var.set(directory)
             # Update config
             self.scope.config.set_save_directory(directory)
+            self._refresh_config_snapshot()
     
-    def capture_screenshot(self):
-        """Capture screenshot from the oscilloscope"""
+    def capture_screenshot(self, use_subdirs=False):
+        """Capture screenshot from the oscilloscope
+
+        Args:
+            use_subdirs: Save below the subdirectory rows of the Engineering/Advanced layout
+        """
         if not self.scope.is_connected():
             messagebox.showwarning("Not Connected", "No oscilloscope connected. Please scan for devices first.")
             return
 
         try:
             save_dir = self.save_dir_var.get()
-            base_filename = self.filename_var.get()
-            suffix = self.file_format_var.get()
-
-            # Get filename using SimpleScope API (handles auto_increment/datestamp)
-            filename_ = self.scope.get_capture_filename(save_dir, base_filename, suffix)
+            if use_subdirs:
+                subdir_path = self._get_subdirectory_path()
+                if subdir_path:
+                    save_dir = os.path.join(save_dir, subdir_path)
 
-            screenshot_data = self.scope.capture(save_dir=save_dir,
-                               filename=Path(filename_).stem,
-                               suffix=suffix,
-                               bg_color=self.bg_color_var.get(),
-                               save_waveform=self.save_waveform_var.get(),
-                               metadata={key: var.get() for key, (_, var) in self.metadata_fields.items()}
-                               )
+                # Create subdirectory if it doesn't exist
+                os.makedirs(save_dir, exist_ok=True)
 
-            # Display captured image if enabled
-            self._display_captured_image(screenshot_data)
+            self._start_capture(save_dir)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to capture screenshot: {str(e)}")
 
+    def _capture_with_subdirectories(self):
+        """Capture button of the Engineering and Advanced layouts"""
+        self.capture_screenshot(use_subdirs=True)
+
+    def _start_capture(self, save_dir):
+        """Run the capture in a background thread so the UI keeps responding during the transfer"""
+        if self._running(self._capture_thread):
+            return  # capture already in progress
+        if self._running(self._scan_thread):
+            # The scan may be swapping the driver this capture would use
+            messagebox.showinfo("Busy", "Wait for the scan to finish before capturing.")
+            return
+
+        for button in self._capture_buttons:
+            button.state(['disabled'])
+        self._capture_thread = self._run_in_background(
+            self._capture_worker, self._on_capture_done,
+            save_dir, self.filename_var.get(), self.file_format_var.get(), self.bg_color_var.get(),
+            self.save_waveform_var.get(), self._collect_metadata())
+
+    def _capture_worker(self, save_dir, base_filename, suffix, bg_color, save_waveform, metadata):
+        """Capture off the Tk thread
+
+        Returns:
+            bytes: The screenshot image data
+        """
+        # Get filename using SimpleScope API (handles auto_increment/datestamp)
+        filename_ = self.scope.get_capture_filename(save_dir, base_filename, suffix)
+
+        return self.scope.capture(save_dir=save_dir,
+                                  filename=os.path.splitext(filename_)[0],
+                                  suffix=suffix,
+                                  bg_color=bg_color,
+                                  save_waveform=save_waveform,
+                                  metadata=metadata
+                                  )
+
+    def _on_capture_done(self, ok, result):
+        """Re-enable capture and show the image or error (Tk thread)"""
+        for button in self._capture_buttons:
+            button.state(['!disabled'])
+
+        if not ok:
+            messagebox.showerror("Error", f"Failed to capture screenshot: {str(result)}")
+            return
+
+        self._refresh_config_snapshot()
+        if self._shown_layout in self._layout_save_dirs:
+            # The shown layout's rows produced this directory; they are current
+            self._layout_save_dirs[self._shown_layout] = self._cfg_save_dir
+
+        # Display captured image if enabled
+        self._display_captured_image(result)
+
     def _initialize_help_tab(self):
         """Initialize the Help tab with help documentation and toggleable log display"""
         frame = ttk.Frame(self.help_tab, padding=(20, 10))
@@ -905,14 +1168,17 @@ class ScopeCaptureGUI(tk.Tk):
         scrollbar = ttk.Scrollbar(log_frame)
         scrollbar.pack(side='right', fill='y')
 
-        self.log_listbox = tk.Listbox(log_frame, yscrollcommand=scrollbar.set,
-                                       font=('Consolas', 9), selectmode='extended',
-                                       height=12)
-        self.log_listbox.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=self.log_listbox.yview)
+        # Read-only Text (like the help view): appends are one insert of joined lines
+        self.log_text = tk.Text(log_frame, yscrollcommand=scrollbar.set,
+                                font=('Consolas', 9), wrap='none', height=12,
+                                state='disabled')
+        self.log_text.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=self.log_text.yview)
 
-        # Register callback to receive log updates
-        self.scope.log_handler.add_callback(self._on_log_entry)
+        # Receive log updates in batches: the handler queues records from any
+        # thread and a Tk timer delivers them here, one insert per batch
+        self.scope.log_handler.add_batch_callback(self._on_log_records)
+        self.after(LOG_POLL_MS, self._poll_log_records)
 
         # Load existing log entries
         self._refresh_log_display()
@@ -940,59 +1206,92 @@ class ScopeCaptureGUI(tk.Tk):
             self.log_container.pack_forget()
             self.help_label_frame.pack(fill='both', expand=True, pady=(0, 10))
 
-    def _on_log_entry(self, record):
-        """Callback when a new log record is added."""
-        # Use after() to ensure thread safety with tkinter
-        formatted = self.scope.log_handler.format(record)
-        self.after(0, lambda: self._add_log_entry_to_display(formatted))
-
-    def _add_log_entry_to_display(self, entry):
-        """Add a single log entry to the listbox."""
-        self.log_listbox.insert(tk.END, entry)
-        self.log_listbox.see(tk.END)  # Auto-scroll to bottom
+    def _poll_log_records(self):
+        """Timer on the Tk thread: hand queued log records to _on_log_records."""
+        self.scope.log_handler.flush_pending()
+        self.after(LOG_POLL_MS, self._poll_log_records)
+
+    def _on_log_records(self, records):
+        """Append a batch of new log records to the log view in one call."""
+        format_record = self.scope.log_handler.format
+        entries = [format_record(record) for record in records[-LOG_DISPLAY_MAX:]]
+        self.log_text.config(state='normal')
+        self.log_text.insert('end', '\n'.join(entries) + '\n')
+        # Drop the oldest lines in one call once over the cap ('end-1c' is
+        # on the empty line after the last newline)
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - LOG_DISPLAY_MAX
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+        self.log_text.config(state='disabled')
+        self.log_text.see('end')  # Auto-scroll to bottom
 
     def _refresh_log_display(self):
         """Refresh the log display with all current entries."""
-        self.log_listbox.delete(0, tk.END)
-        for entry in self.scope.log_handler.entries:
-            self.log_listbox.insert(tk.END, entry)
+        handler = self.scope.log_handler
+        entries = [handler.format(record) for record in handler.tail(LOG_DISPLAY_MAX)]
+        self.log_text.config(state='normal')
+        self.log_text.delete('1.0', 'end')
+        if entries:
+            self.log_text.insert('end', '\n'.join(entries) + '\n')
+        self.log_text.config(state='disabled')
 
     def _save_log(self):
-        """Save the log to a file."""
-        try:
-            filepath = self.scope.save_log()
-            messagebox.showinfo("Log Saved", f"Log saved to:\n{filepath}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save log: {str(e)}")
+        """Save the log to a file in a background thread."""
+        if self._running(self._log_save_thread):
+            return  # save already in progress
+
+        self._log_save_thread = self._run_in_background(self.scope.save_log, self._on_log_saved)
+
+    def _on_log_saved(self, ok, result):
+        """Report the saved log path or the error (Tk thread)"""
+        if ok:
+            messagebox.showinfo("Log Saved", f"Log saved to:\n{result}")
+        else:
+            messagebox.showerror("Error", f"Failed to save log: {str(result)}")
 
     def _initialize_about_tab(self):
         """Initialize the About tab with author and project information"""
         frame = ttk.Frame(self.about_tab, padding=(20, 10))
         frame.pack(fill='both', expand=True)
 
-        ttk.Label(frame, text="About Simple Scope", font=('TkDefaultFont', 14, 'bold')).pack(anchor='w', pady=(0, 10))
-
-        # Version info
-        ttk.Label(frame, text=f"Version: {self.scope.version}").pack(anchor='w', pady=(0, 20))
-
-        # Author info
-        ttk.Label(frame, text="Author:", font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 2))
-        ttk.Label(frame, text="Niel Walker").pack(anchor='w', padx=(20, 0))
+        # One read-only Text with tagged ranges instead of a Label per line
+        text = tk.Text(frame, wrap='word', cursor='arrow', relief='flat', borderwidth=0,
+                       highlightthickness=0, background=ttk.Style().lookup('TFrame', 'background'))
+        text.pack(fill='both', expand=True)
+
+        text.tag_configure('title', font=('TkDefaultFont', 14, 'bold'), spacing3=10)
+        text.tag_configure('version', spacing3=20)
+        text.tag_configure('heading', font=('TkDefaultFont', 10, 'bold'), spacing1=10, spacing3=2)
+        text.tag_configure('value', lmargin1=20, lmargin2=20)
+        text.tag_configure('link', foreground='blue')
+        text.tag_bind('link', '<Enter>', lambda e: text.configure(cursor='hand2'))
+        text.tag_bind('link', '<Leave>', lambda e: text.configure(cursor='arrow'))
+
+        text.insert('end', "About Simple Scope\n", 'title')
+        text.insert('end', f"Version: {self.scope.version}\n", 'version')
+
+        entries = (
+            ("Author:", "Niel Walker", None),
+            ("Email:", "nielandrewalker@gmail.com", None),
+            ("GitHub:", "https://github.com/OnePieceWithoutWax", "https://github.com/OnePieceWithoutWax"),
+            ("Project Repository:", "https://github.com/OnePieceWithoutWax/Simple_Scope",
+             "https://github.com/OnePieceWithoutWax/Simple_Scope"),
+        )
+        for n, (heading, value, url) in enumerate(entries):
+            text.insert('end', heading + "\n", 'heading')
+            if url is None:
+                text.insert('end', value + "\n", 'value')
+            else:
+                # Each link gets its own tag so the click handler knows its URL
+                url_tag = f'url{n}'
+                text.insert('end', value + "\n", ('value', 'link', url_tag))
+                text.tag_bind(url_tag, '<Button-1>', lambda e, url=url: self._open_url(url))
 
-        # Email
-        ttk.Label(frame, text="Email:", font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 2))
-        ttk.Label(frame, text="nielandrewalker@gmail.com").pack(anchor='w', padx=(20, 0))
+        text.configure(state='disabled')
 
-        # GitHub profile
-        ttk.Label(frame, text="GitHub:", font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 2))
-        github_link = tk.Label(frame, text="https://github.com/OnePieceWithoutWax",
-                               fg="blue", cursor="hand2")
-        github_link.pack(anchor='w', padx=(20, 0))
-        github_link.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/OnePieceWithoutWax"))
+    @staticmethod
+    def _open_url(url):
+        """Open a link from the About tab in the default browser"""
+        import webbrowser  # pulls in subprocess; defer until a link is clicked
 
-        # Project repository
-        ttk.Label(frame, text="Project Repository:", font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 2))
-        repo_link = tk.Label(frame, text="https://github.com/OnePieceWithoutWax/Simple_Scope",
-                             fg="blue", cursor="hand2")
-        repo_link.pack(anchor='w', padx=(20, 0))
-        repo_link.bind("<Button-1>", lambda e: webbrowser.open("https://github.com/OnePieceWithoutWax/Simple_Scope"))
+        webbrowser.open(url)
@@ -3,43 +3,109 @@ Logging module for Simple Scope application using Python's built-in logging.
 Provides a custom ListHandler for in-memory storage and GUI display.
 """
 import logging
+import queue
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Callable, List
 from pathlib import Path
 
 
+# Default number of records kept by ListHandler; older records are dropped
+DEFAULT_LOG_CAPACITY = 10_000
+
+# Records waiting for flush_pending() beyond which new ones skip the batch queue
+PENDING_HIGH_WATER = 4096
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that formats the timestamp once per second.
+
+    Only valid for date formats without sub-second fields (no %(msecs)).
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._time_cache = (None, "")  # (whole second, formatted text)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, text)
+        return text
+
+
 class ListHandler(logging.Handler):
-    """Custom logging handler that stores log records in a list.
+    """Custom logging handler that stores the most recent log records.
 
-    Supports callbacks for live GUI updates and provides access to
-    formatted log entries.
+    Records are kept in a ring buffer of ``capacity`` entries. Supports
+    callbacks for live GUI updates and provides access to formatted log
+    entries.
     """
 
-    def __init__(self, level: int = logging.DEBUG):
+    def __init__(self, level: int = logging.DEBUG, capacity: int = DEFAULT_LOG_CAPACITY):
         super().__init__(level)
-        self._records: List[logging.LogRecord] = []
+        self._records: deque[logging.LogRecord] = deque(maxlen=capacity)
         self._callbacks: List[Callable[[logging.LogRecord], None]] = []
+        self._batch_callbacks: List[Callable[[List[logging.LogRecord]], None]] = []
+        self._pending: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._dropped_pending = 0  # skipped since the last flush_pending()
+        self._evicted = 0  # oldest records pushed out of the full ring buffer
 
         # Set default formatter
-        self.setFormatter(logging.Formatter(
+        self.setFormatter(_SecondCachedFormatter(
             "[%(asctime)s] %(levelname)-7s [%(name)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         ))
 
     @property
     def records(self) -> List[logging.LogRecord]:
-        """Raw log records."""
-        return self._records.copy()
+        """Raw log records (a copy; see snapshot())."""
+        return self.snapshot()
+
+    def snapshot(self) -> List[logging.LogRecord]:
+        """An owned copy of the stored records, oldest first."""
+        return list(self._records)
+
+    def tail(self, n: int) -> List[logging.LogRecord]:
+        """The last n log records, oldest first, without copying the whole buffer."""
+        return list(islice(reversed(self._records), n))[::-1]
 
     @property
     def entries(self) -> List[str]:
         """Formatted log entries as strings."""
-        return [self.format(record) for record in self._records]
+        # Snapshot first: iterating the deque while another thread logs would raise
+        return [self.format(record) for record in self.snapshot()]
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the text from earlier calls.
+
+        Stored records are formatted for the live display, again on every
+        display refresh and again when saving; strftime/% formatting runs once.
+        """
+        cached = record.__dict__.get('_list_handler_text')
+        if cached is not None and cached[0] is self.formatter:
+            return cached[1]
+        text = super().format(record)
+        record._list_handler_text = (self.formatter, text)
+        return text
 
     def emit(self, record: logging.LogRecord) -> None:
         """Handle a log record."""
+        if len(self._records) == self._records.maxlen:
+            self._evicted += 1
         self._records.append(record)
 
+        # Batch consumers pick the record up in the next flush_pending(). If
+        # the consumer has stalled, skip the queue (the record is still stored)
+        if self._batch_callbacks:
+            if self._pending.qsize() < PENDING_HIGH_WATER:
+                self._pending.put_nowait(record)
+            else:
+                self._dropped_pending += 1
+
         # Notify callbacks
         for callback in self._callbacks:
             try:
@@ -50,11 +116,45 @@ class ListHandler(logging.Handler):
     def clear(self) -> None:
         """Clear all stored log records."""
         self._records.clear()
+        self._evicted = 0
 
     def add_callback(self, callback: Callable[[logging.LogRecord], None]) -> None:
         """Register a callback to be notified of new log records."""
         self._callbacks.append(callback)
 
+    def add_batch_callback(self, callback: Callable[[List[logging.LogRecord]], None]) -> None:
+        """Register a callback that receives new records in batches.
+
+        Records are queued by emit() (from any thread) and delivered as one
+        list per flush_pending() call, which the consumer runs on its own
+        schedule (e.g. a Tk after() timer).
+        """
+        self._batch_callbacks.append(callback)
+
+    def flush_pending(self) -> None:
+        """Deliver all records queued since the last call to the batch callbacks."""
+        batch = []
+        try:
+            while True:
+                batch.append(self._pending.get_nowait())
+        except queue.Empty:
+            pass
+        if self._dropped_pending:
+            batch.append(logging.makeLogRecord({
+                'name': 'SimpleScope.log',
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f"Discarded {self._dropped_pending} log records from the live view",
+            }))
+            self._dropped_pending = 0
+        if not batch:
+            return
+        for callback in self._batch_callbacks:
+            try:
+                callback(batch)
+            except Exception:
+                pass  # Don't let callback errors break logging
+
     def remove_callback(self, callback: Callable[[logging.LogRecord], None]) -> None:
         """Remove a registered callback."""
         if callback in self._callbacks:
@@ -73,13 +173,17 @@ class ListHandler(logging.Handler):
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"Simple Scope Log - Saved: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Application Version: {app_version}\n")
-            f.write("=" * 60 + "\n\n")
+        # Build the whole file in memory and write it in one call
+        header = (f"Simple Scope Log - Saved: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                  f"Application Version: {app_version}\n")
+        if self._evicted:
+            header += f"{self._evicted} older records discarded (buffer holds the last {self._records.maxlen})\n"
+        header += "=" * 60 + "\n\n"
+        lines = self.entries
+        body = "\n".join(lines) + "\n" if lines else ""
 
-            for entry in self.entries:
-                f.write(entry + "\n")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(header + body)
 
         return filepath
 
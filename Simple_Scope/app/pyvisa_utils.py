@@ -2,10 +2,78 @@
 Utility functions for the Oscilloscope Screenshot Capture Application
 Source from: nwlab.lab.pymeasure_extensions
 """
+import atexit
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pyvisa
 from typing import Dict, List, Optional, Any
 
 
+# Upper bound on instruments identified in parallel by find_instruments
+MAX_PROBE_WORKERS = 8
+
+# VISA timeout (ms) for the *IDN? probe; bounds how long a silent/non-SCPI
+# resource (e.g. an unused serial port) can hold up a scan
+PROBE_TIMEOUT_MS = 1000
+
+# Shared ResourceManager, created on first use; see get_resource_manager
+_resource_manager = None
+_resource_manager_lock = threading.Lock()
+
+# VISA address -> *IDN? response from a previous scan; rescans only query new addresses
+_idn_cache: Dict[str, str] = {}
+_idn_cache_lock = threading.Lock()
+
+
+def get_resource_manager() -> pyvisa.ResourceManager:
+    """
+    Return the process-wide VISA ResourceManager, creating it on first use.
+
+    Opening a ResourceManager loads and initializes the VISA library, so scans
+    and connections share one instead of creating a new one each time. It is
+    closed at interpreter exit.
+    """
+    global _resource_manager
+    with _resource_manager_lock:
+        if _resource_manager is None:
+            _resource_manager = pyvisa.ResourceManager()
+            atexit.register(close_resource_manager)
+        return _resource_manager
+
+
+def close_resource_manager() -> None:
+    """Close the shared ResourceManager (and any sessions still open on it)."""
+    global _resource_manager
+    with _resource_manager_lock:
+        if _resource_manager is not None:
+            _resource_manager.close()
+            _resource_manager = None
+
+
+def forget_instrument(addr: str) -> None:
+    """Drop a cached identification so the next scan queries the address again."""
+    with _idn_cache_lock:
+        _idn_cache.pop(addr, None)
+
+
+# *IDN? response: four comma-separated fields (whitespace around each trimmed),
+# optionally followed by further vendor-specific fields
+_IDN_RE = re.compile(
+    r'\s*(?P<manufacturer>[^,]*?)\s*,\s*(?P<model_num>[^,]*?)\s*,'
+    r'\s*(?P<serial_num>[^,]*?)\s*,\s*(?P<software_rev>[^,]*?)\s*(?:,(?P<other>.*))?',
+    re.DOTALL,
+)
+
+# Result for strings that don't match _IDN_RE; copied, never returned directly
+_EMPTY_IDN = {
+    "manufacturer": None,
+    "model_num": None,
+    "serial_num": None,
+    "software_rev": None
+}
+
+
 def scpi_id_parser(id_string: str) -> Dict[str, Optional[str]]:
     """
     Parse the SCPI identification string into its components.
@@ -20,30 +88,19 @@ def scpi_id_parser(id_string: str) -> Dict[str, Optional[str]]:
     Dict[str, Optional[str]]
         Dictionary containing manufacturer, model_num, serial_num, and software_rev
     """
-    # Initialize with None values
-    result = {
-        "manufacturer": None,
-        "model_num": None,
-        "serial_num": None,
-        "software_rev": None
-    }
-    
     # Only try to parse if we have a non-empty string
-    if id_string and isinstance(id_string, str):
-        id_parts = id_string.split(',')
-        if len(id_parts) == 4:
-            result["manufacturer"] = id_parts[0].strip()
-            result["model_num"] = id_parts[1].strip()
-            result["serial_num"] = id_parts[2].strip()
-            result["software_rev"] = id_parts[3].strip()
-        
-        if len(id_parts) > 4:
-            result["other"] = id_parts[4:]
-    
+    match = _IDN_RE.fullmatch(id_string) if id_string and isinstance(id_string, str) else None
+    if match is None:
+        return _EMPTY_IDN.copy()
+
+    result = match.groupdict()
+    other = result.pop("other")
+    if other is not None:
+        result["other"] = other.split(',')
     return result
 
 
-def find_instruments(verbose: bool = False, logger=None) -> List[Dict[str, Any]]:
+def find_instruments(verbose: bool = False, logger=None, refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Find and identify all VISA instruments connected to the system.
 
@@ -56,6 +113,9 @@ def find_instruments(verbose: bool = False, logger=None) -> List[Dict[str, Any]]
         Whether to print detailed information during discovery (default: False)
     logger : Logger, optional
         Logger instance for logging messages (default: None)
+    refresh : bool, optional
+        Query every instrument again instead of reusing identifications from
+        earlier scans for addresses that are still present (default: False)
 
     Returns:
     --------
@@ -76,47 +136,66 @@ def find_instruments(verbose: bool = False, logger=None) -> List[Dict[str, Any]]
                 getattr(logger, level)(message)
             else:
                 print(message)
-    rm = pyvisa.ResourceManager()
-    found = []
-    
-    try:
-        instrs = rm.list_resources()
-        
-        for n, instr in enumerate(instrs):
-            instrument_info = {
-                "n": n,
-                "addr": instr,
-                "id": "Not known",
-                "manufacturer": None,
-                "model_num": None,
-                "serial_num": None,
-                "software_rev": None
-            }
-            
-            # Try to communicate with the instrument
+    rm = get_resource_manager()
+    instrs = rm.list_resources()
+
+    # Forget instruments that are gone (or everything, on refresh)
+    with _idn_cache_lock:
+        present = set(instrs) if not refresh else set()
+        for addr in [addr for addr in _idn_cache if addr not in present]:
+            del _idn_cache[addr]
+
+    def _probe(n: int, instr: str) -> Dict[str, Any]:
+        """Identify one instrument, from the cache or by querying *IDN?"""
+        instrument_info = {
+            "n": n,
+            "addr": instr,
+            "id": "Not known",
+            "manufacturer": None,
+            "model_num": None,
+            "serial_num": None,
+            "software_rev": None
+        }
+
+        with _idn_cache_lock:
+            cached_idn = _idn_cache.get(instr)
+        if cached_idn is not None:
+            instrument_info["id"] = cached_idn
+            instrument_info.update(scpi_id_parser(cached_idn))
+            _log_verbose(f"{n}: {instr}: {cached_idn} (cached)", "info")
+            return instrument_info
+
+        # Try to communicate with the instrument
+        try:
+            res = rm.open_resource(instr, timeout=PROBE_TIMEOUT_MS)
             try:
-                res = rm.open_resource(instr)
-                try:
-                    # Query instrument identification
-                    idn = res.query('*idn?').strip()
-                    instrument_info["id"] = idn
-                    # Parse the identification string
-                    instrument_info.update(scpi_id_parser(idn))
-                except pyvisa.Error as query_error:
-                    _log_verbose(f"Cannot query identification for {instr}: {query_error}")
-                finally:
-                    # Always close the resource
-                    res.close()
-            except pyvisa.VisaIOError as e:
-                _log_verbose(f"{n}: {instr}: Visa IO Error: check connections", "warning")
-                _log_verbose(f"Error details: {e}", "warning")
-            
-            _log_verbose(f"{n}: {instr}: {instrument_info['id']}", "info")
-            
-            found.append(instrument_info)
-    
-    finally:
-        # Ensure the resource manager is closed
-        rm.close()
-    
+                # Query instrument identification
+                idn = res.query('*idn?').strip()
+                instrument_info["id"] = idn
+                with _idn_cache_lock:
+                    _idn_cache[instr] = idn
+                # Parse the identification string
+                instrument_info.update(scpi_id_parser(idn))
+            except pyvisa.Error as query_error:
+                _log_verbose(f"Cannot query identification for {instr}: {query_error}")
+            finally:
+                # Always close the resource
+                res.close()
+        except pyvisa.VisaIOError as e:
+            _log_verbose(f"{n}: {instr}: Visa IO Error: check connections", "warning")
+            _log_verbose(f"Error details: {e}", "warning")
+
+        _log_verbose(f"{n}: {instr}: {instrument_info['id']}", "info")
+        return instrument_info
+
+    # Probe instruments concurrently so a scan takes about as long as the
+    # slowest instrument rather than the sum; results keep list_resources() order
+    with _idn_cache_lock:
+        to_query = sum(1 for instr in instrs if instr not in _idn_cache)
+    if to_query > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, to_query)) as executor:
+            found = list(executor.map(_probe, range(len(instrs)), instrs))
+    else:
+        found = [_probe(n, instr) for n, instr in enumerate(instrs)]
+
     return found
@@ -3,7 +3,19 @@ Controller for communicating with the oscilloscope via pyvisa
 """
 # import time
 # import pathlib
-import pyvisa
+from contextlib import contextmanager
+from app.pyvisa_utils import get_resource_manager
+from app.utils import filename_with_suffix as _filename_with_suffix
+
+# Bytes requested per VISA read call (pyvisa defaults to 20 KB); large enough
+# that a screenshot or waveform comes back in one or two transfers
+READ_CHUNK_SIZE = 1024 * 1024
+
+# VISA timeouts (ms): the default for ordinary commands/queries, and longer
+# ones applied with ScopeDriver.temporary_timeout() around slow operations
+DEFAULT_TIMEOUT_MS = 5000
+RENDER_TIMEOUT_MS = 15000  # instrument-side work, e.g. writing a screenshot file
+TRANSFER_TIMEOUT_MS = 30000  # large reads, e.g. an image or a long waveform record
 
 class ScopeDriver:
     """Base Controller class for oscilloscope
@@ -18,19 +30,34 @@ class ScopeDriver:
         self.adaptor = None
         self.name = name
         self._address = None
-        self.logger = logger
+        self.logger = logger  # property; also binds the per-level log methods
+        self._scpi_cache = {}  # identity query replies (*IDN?, *OPT?) for this connection
 
         self.address = address  # property to set the address
 
-    def _log(self, level: str, message: str) -> None:
+    @property
+    def logger(self):
+        """Logger used by _log (may be None)"""
+        return self._logger
+
+    @logger.setter
+    def logger(self, logger):
+        """Set the logger and bind its level methods once, rather than per _log call"""
+        self._logger = logger
+        self._log_methods = {level: getattr(logger, level)
+                             for level in ('debug', 'info', 'warning', 'error')} if logger else {}
+
+    def _log(self, level: str, message: str, *args) -> None:
         """Log a message if logger is available.
 
         Args:
             level: Log level ('debug', 'info', 'warning', 'error')
-            message: Message to log
+            message: Message to log; may use %-style placeholders filled from args
+                only if the level is enabled
         """
-        if self.logger:
-            getattr(self.logger, level)(message)
+        method = self._log_methods.get(level)
+        if method is not None:
+            method(message, *args)
 
 
     @property
@@ -45,6 +72,7 @@ class ScopeDriver:
             self.adaptor.close()
         self._address = address
         self.adaptor = None  # Reset device to None when address changes
+        self._scpi_cache.clear()  # a different address may be a different instrument
         if address is not None:
             self.connect()  # Attempt to connect to the new address
 
@@ -55,12 +83,18 @@ class ScopeDriver:
 
         if self.address is None: # assert self.address is not None,
             raise ValueError("Device address is not set.")
-        
-        self.resource_manager = pyvisa.ResourceManager()
+
+        if self.adaptor is not None:
+            return True  # already connected to this address (the setter resets adaptor)
+
+        # Shared across scans and connections; see get_resource_manager
+        self.resource_manager = get_resource_manager()
         
         try:
             self.adaptor = self.resource_manager.open_resource(self.address)
-            self.adaptor.timeout = 5000  # Set timeout to 5 seconds
+            self.adaptor.timeout = DEFAULT_TIMEOUT_MS
+            self.adaptor.query_delay = 0  # no sleep between a query's write and read
+            self.adaptor.chunk_size = READ_CHUNK_SIZE
             self._log("info", f"Connected to device at {self.address}")
             return True
         except Exception as e:
@@ -78,14 +112,34 @@ class ScopeDriver:
             # print("No oscilloscope connected.")
             pass
         
-        if self.resource_manager is not None:
-            # self.resource_manager.close() # or equivialent?
-            self.resource_manager = None
+        # The shared ResourceManager stays open for the next scan/connection
+        self.resource_manager = None
 
 
     def is_connected(self):
         """Check if a scope is connected"""
         return self.adaptor is not None
+
+    @contextmanager
+    def temporary_timeout(self, ms):
+        """Temporarily use a different VISA timeout (in ms) for a slow operation"""
+        previous = self.adaptor.timeout
+        self.adaptor.timeout = ms
+        try:
+            yield
+        finally:
+            self.adaptor.timeout = previous
+
+    @contextmanager
+    def temporary_read_termination(self, termination):
+        """Temporarily use a different read termination (None for raw binary reads)"""
+        # pyvisa's read_termination_context() doesn't restore it if the body raises
+        previous = self.adaptor.read_termination
+        self.adaptor.read_termination = termination
+        try:
+            yield
+        finally:
+            self.adaptor.read_termination = previous
     
     
     @staticmethod
@@ -100,14 +154,7 @@ class ScopeDriver:
         Returns:
             str: Filename with appended suffix
         """
-        if not suffix.startswith("."):
-            suffix = "." + suffix
-        
-        if filename.endswith(suffix):
-            return filename
-        
-        filename = filename + suffix
-        return filename   
+        return _filename_with_suffix(filename, suffix)
 
 
     def capture_screenshot(self, save_dir, filename, suffix='.png',  bg_color="white", save_waveform=False, metadata=None, *args, **kwargs):
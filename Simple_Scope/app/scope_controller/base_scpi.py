@@ -7,17 +7,24 @@ log.addHandler(logging.NullHandler())
 class SCPIMixin:
     """Mixin class for SCPI instruments.
 
-    Assumes ``self.adaptor`` is a pyvisa resource and ``self.name`` is available
-    (both provided by ScopeDriver). Intended to be used via multiple inheritance
+    Assumes ``self.adaptor`` is a pyvisa resource, ``self.name`` is available and
+    ``self._scpi_cache`` is a dict cleared on reconnect (all provided by ScopeDriver). Intended to be used via multiple inheritance
     alongside ScopeDriver.
     """
 
     # --- Read-only properties (queries) ---
 
+    def _cached_query(self, scpi):
+        """Query once per connection; for replies that can't change while connected."""
+        response = self._scpi_cache.get(scpi)
+        if response is None:
+            response = self._scpi_cache[scpi] = self.adaptor.query(scpi).strip()
+        return response
+
     @property
     def id(self):
-        """Instrument identification string (*IDN?)."""
-        return self.adaptor.query("*IDN?").strip()
+        """Instrument identification string (*IDN?), cached per connection."""
+        return self._cached_query("*IDN?")
 
     @property
     def complete(self):
@@ -31,8 +38,8 @@ class SCPIMixin:
 
     @property
     def options(self):
-        """Device options installed (*OPT?)."""
-        return self.adaptor.query("*OPT?").strip()
+        """Device options installed (*OPT?), cached per connection."""
+        return self._cached_query("*OPT?")
 
     @property
     def next_error(self):
@@ -42,11 +49,34 @@ class SCPIMixin:
             tuple: (code: int, message: str)
         """
         response = self.adaptor.query("SYST:ERR?").strip()
+        if response.startswith(("0,", "+0,")):
+            return 0, ""  # '0,"No error"', by far the most common reply
         parts = response.split(",", 1)
         code = int(parts[0])
         message = parts[1].strip('"') if len(parts) > 1 else ""
         return code, message
 
+    # --- Query helpers ---
+
+    def _query_floats(self, scpi, n):
+        """Send a (possibly ;-chained) query and parse the reply as floats.
+
+        Args:
+            scpi (str): Query string, e.g. "WFMOUTPRE:XINCR?;YMULT?;YOFF?"
+            n (int): Number of values expected in the reply
+
+        Returns:
+            tuple[float, ...]: The n values, in query order
+
+        Raises:
+            ValueError: If the reply does not contain exactly n values
+        """
+        response = self.adaptor.query(scpi).strip()
+        values = tuple(float(part) for part in response.split(";"))
+        if len(values) != n:
+            raise ValueError(f"Expected {n} values from {scpi!r}, got {response!r}")
+        return values
+
     # --- Command methods ---
 
     def clear(self):
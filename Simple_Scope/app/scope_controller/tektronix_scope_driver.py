@@ -5,9 +5,17 @@ Controller for communicating with the oscilloscope via pyvisa
 # import time
 # import pathlib
 from pathlib import Path
-from .base_scope_driver import ScopeDriver
+from .base_scope_driver import ScopeDriver, RENDER_TIMEOUT_MS, TRANSFER_TIMEOUT_MS
 from .base_scpi import SCPIMixin
 
+try:
+    import numpy as np
+except ImportError:  # optional speedup for waveform export, fall back to pure Python
+    np = None
+
+# Files removed per chained FILESystem:DELEte write, to stay within the scope's input buffer
+DELETE_BATCH_SIZE = 20
+
 class TektronixScopeDriver(ScopeDriver, SCPIMixin):
     """Controller class for Tektronix MSO5x oscilloscope"""
 
@@ -31,6 +39,16 @@ class TektronixScopeDriver(ScopeDriver, SCPIMixin):
         self.clear_temp_directory()
 
 
+    def disconnect(self):
+        """Remove the screenshot temp file from the scope, then disconnect"""
+        if self.adaptor is not None:
+            try:
+                self.adaptor.write(f'FILESystem:DELEte "{self._scope_temp_dir}/temp.png"')
+            except Exception as e:
+                self._log('warning', f"Could not remove scope temp file: {e}")
+        super().disconnect()
+
+
     def clear_temp_directory(self) -> None:
         """
         Delete all files in the scope's temp directory.
@@ -40,20 +58,21 @@ class TektronixScopeDriver(ScopeDriver, SCPIMixin):
             self._scope_temp_dir: Path to temp directory on scope filesystem
         """
         try:
-            # Get directory listing
-            self.adaptor.write(f'FILESystem:CWD "{self._scope_temp_dir}"')
-            dir_contents = self.adaptor.query('FILESystem:DIR?').strip()
+            # Get directory listing (CWD and DIR? chained into one query)
+            dir_contents = self.adaptor.query(
+                f'FILESystem:CWD "{self._scope_temp_dir}";:FILESystem:DIR?').strip()
             
             if dir_contents and dir_contents != '""':
                 # Parse the directory listing (format may vary by scope model)
                 # Typically returns comma-separated list of files
                 files = [f.strip('"') for f in dir_contents.split(',') if f.strip()]
-                
-                for filename in files:
-                    if filename and filename not in ['.', '..']:
-                        file_path = f"{self._scope_temp_dir}/{filename}"
-                        self.adaptor.write(f'FILESystem:DELEte "{file_path}"')
-                        self._log('info', f"Deleted from scope: {file_path}")
+                commands = [f'FILESystem:DELEte "{self._scope_temp_dir}/{filename}"'
+                            for filename in files if filename and filename not in ['.', '..']]
+
+                # One chained write per batch instead of one write per file
+                for start in range(0, len(commands), DELETE_BATCH_SIZE):
+                    self.adaptor.write(";:".join(commands[start:start + DELETE_BATCH_SIZE]))
+                self._log('info', f"Deleted {len(commands)} files from scope: {self._scope_temp_dir}")
             else:
                 self._log('info', f"Scope temp directory is empty: {self._scope_temp_dir}")
 
@@ -85,13 +104,11 @@ class TektronixScopeDriver(ScopeDriver, SCPIMixin):
         file_path = save_path / filename
         
         try:
+            # get_screenshot_brian blocks on *OPC? until the scope has written the image
             imgData = self.get_screenshot_brian()
             
-            # Wait a moment for the scope to generate the image
             with open(file_path, "wb") as file:
-                # file = open(fileName, "wb") # Save image data to local disk
                 file.write(imgData)
-                file.close()
 
             self._log("info", f"Saved: {file_path}")
             
@@ -118,19 +135,24 @@ class TektronixScopeDriver(ScopeDriver, SCPIMixin):
         self._log("debug", "get_screenshot_brian: starting capture sequence")
         try:
             #Screen Capture on Tektronix Windows Scope
-            self.adaptor.write(f'SAVE:IMAGe \"{self._scope_temp_dir}/temp.png\"') # Take a scope shot
-            self._log("debug", f"wrote to save image at {self._scope_temp_dir}/temp.png on scope")
-            self.adaptor.query('*OPC?') # Wait for instrument to finish writing image to disk
-            self._log("debug", "OPC done")
+            # Take a scope shot and wait for the instrument to finish writing it to
+            # disk (*OPC?) in one chained query
+            with self.temporary_timeout(RENDER_TIMEOUT_MS):
+                self.adaptor.query(f'SAVE:IMAGe \"{self._scope_temp_dir}/temp.png\";*OPC?')
+            self._log("debug", "saved image at %s/temp.png on scope, OPC done", self._scope_temp_dir)
 
             self.adaptor.write(f'FILESystem:READFile "{self._scope_temp_dir}/temp.png"') # Read temp image file from instrument
 
-            img_data = self.adaptor.read_raw(1024*1024) # return that read...
+            # read_raw() reads chunk_size pieces until the message END, so the
+            # transfer stops as soon as the file has been sent. With a read
+            # termination set, VISA would also stop at the first LF byte in the PNG
+            with self.temporary_read_termination(None), self.temporary_timeout(TRANSFER_TIMEOUT_MS):
+                img_data = self.adaptor.read_raw()
             self._log("debug", "reading the image back to computer")
 
-            self.adaptor.write(f'FILESystem:DELEte "{self._scope_temp_dir}/temp.png"') # Remove the Temp.png file
-            self._log("debug", "Cleaning up temp file")
-            self._log("debug", f"get_screenshot_brian: capture complete, {len(img_data)} bytes read")
+            # temp.png is left on the scope: the next SAVE:IMAGe overwrites it, and
+            # disconnect() removes it
+            self._log("debug", "get_screenshot_brian: capture complete, %d bytes read", len(img_data))
             return img_data
         except Exception as e:
             code, message = self.next_error
@@ -148,27 +170,32 @@ class TektronixScopeDriver(ScopeDriver, SCPIMixin):
         """
         try:
             # Set up data export
-            self.adaptor.write("DATA:SOURCE CH1")
-            self.adaptor.write("DATA:ENCDG ASCII")
-            self.adaptor.write("DATA:START 1")
-            self.adaptor.write("DATA:STOP 10000")  # Adjust as needed
+            # Signed big-endian 16-bit samples: 2 bytes/point instead of ~6 as ASCII,
+            # and no text parsing on this side. One ;-chained write, one round-trip.
+            # DATA:STOP: adjust as needed
+            self.adaptor.write("DATA:SOURCE CH1;:DATA:ENCDG RIBINARY;:DATA:WIDTH 2;"
+                               ":DATA:START 1;:DATA:STOP 10000")
             
             # Get waveform data
-            data = self.adaptor.query("CURVE?")
+            with self.temporary_timeout(TRANSFER_TIMEOUT_MS):
+                counts = self.adaptor.query_binary_values("CURVE?", datatype='h', is_big_endian=True,
+                                                          container=np.ndarray if np is not None else list)
             
-            # Get scaling parameters
-            x_inc = float(self.adaptor.query("WFMOUTPRE:XINCR?"))
-            y_mult = float(self.adaptor.query("WFMOUTPRE:YMULT?"))
-            y_off = float(self.adaptor.query("WFMOUTPRE:YOFF?"))
+            # Get scaling parameters (one chained query)
+            x_inc, y_mult, y_off = self._query_floats("WFMOUTPRE:XINCR?;YMULT?;YOFF?", 3)
             
             # Format data
-            values = data.split(',')
-            with open(file_path, 'w') as f:
-                f.write("Time(s),Voltage(V)\n")
-                for i, val in enumerate(values):
-                    time_val = i * x_inc
-                    voltage = float(val) * y_mult - y_off
-                    f.write(f"{time_val:.9f},{voltage:.6f}\n")
+            if np is not None:
+                # Scale and format all samples in C
+                times = np.arange(counts.size, dtype=np.float64) * x_inc
+                voltages = counts.astype(np.float64) * y_mult - y_off
+                np.savetxt(file_path, np.column_stack((times, voltages)), fmt=('%.9f', '%.6f'),
+                           delimiter=',', header="Time(s),Voltage(V)", comments='')
+            else:
+                lines = [f"{i * x_inc:.9f},{val * y_mult - y_off:.6f}"
+                         for i, val in enumerate(counts)]
+                with open(file_path, 'w') as f:
+                    f.write("Time(s),Voltage(V)\n" + "\n".join(lines) + "\n")
                     
         except Exception as e:
             self._log("error", f"Error saving waveform data: {str(e)}")
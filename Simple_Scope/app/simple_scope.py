@@ -1,11 +1,10 @@
+import os
 import time
-from datetime import datetime
 from pathlib import Path
 from app.config import AppConfig
 from app.version import __version__, log_version_info
 from app.logger import setup_logger
-from .pyvisa_utils import find_instruments
-from app.utils import get_next_incremented_filename, get_filename_with_datestamp, filename_with_suffix
+from app.utils import get_next_incremented_filename, get_filename_with_datestamp, filename_with_suffix, datestamp
 
 
 class SimpleScope:
@@ -24,10 +23,10 @@ class SimpleScope:
         self.scope_addr = None
         self.instrument_list = []
         self.meta = {}
-        self.logger.debug("Loading configuration...")
+        # AppConfig reads its file on first field access, so don't touch a field here
         self.config = AppConfig()
         self.config._logger = self.logger  # Connect logger to config
-        self.logger.debug(f"Config loaded - save_directory: {self.config.save_directory}")
+        self.logger.debug(f"Config file: {self.config._config_file} (loaded on first use)")
         self.recent = dict(save_dir = None,
                             filename = None,
                             suffix = None,
@@ -44,17 +43,20 @@ class SimpleScope:
         """Get the application version."""
         return __version__
 
-    def scan_for_instruments(self, verbose=False):
+    def scan_for_instruments(self, verbose=False, refresh=False):
         """Scan for connected instruments
 
         Args:
             verbose (bool): Whether to print detailed information
+            refresh (bool): Re-query *IDN? on instruments identified by an earlier scan
 
         Returns:
             list: List of dictionaries with instrument info
         """
         self.logger.info("Scanning for instruments...")
-        self.instrument_list = find_instruments(verbose, logger=self.logger)
+        # Imported here so pyvisa loads on the first scan, not while the GUI starts
+        from app.pyvisa_utils import find_instruments
+        self.instrument_list = find_instruments(verbose, logger=self.logger, refresh=refresh)
         self.logger.info(f"Found {len(self.instrument_list)} instrument(s)")
         for instr in self.instrument_list:
             self.logger.debug(f"  - {instr.get('manufacturer', 'Unknown')} {instr.get('model_num', 'Unknown')} at {instr.get('addr', 'Unknown')}")
@@ -164,18 +166,26 @@ class SimpleScope:
                         if model and serial:
                             self.device_id = f"{model} (SN: {serial})"
                         # Save scope info to config
-                        self.config.last_connected_scope = instr.copy()
+                        self.config.update(last_connected_scope=instr.copy())
                         self.logger.debug(f"Saved last connected scope to config: {instr.get('model_num', 'Unknown')}")
                         break
                 self.logger.debug(f"Device ID: {self.device_id}")
             else:
                 self.logger.warning(f"Failed to connect to scope at {address}")
+                self._forget_instrument(address)
 
             return result
         except Exception as e:
             self.logger.error(f"Error setting up scope: {str(e)}", exc_info=True)
+            self._forget_instrument(address)
             return False
 
+    def _forget_instrument(self, address):
+        """Re-identify an address on the next scan after it failed to open"""
+        # A cached *IDN? may belong to a different instrument now at that address
+        from app.pyvisa_utils import forget_instrument
+        forget_instrument(address)
+
     def disconnect(self):
         """Disconnect from the scope"""
         if self.scope:
@@ -237,9 +247,10 @@ class SimpleScope:
 
         self.logger.debug(f"Capture params - dir: {save_dir}, filename: {filename}, suffix: {suffix}, bg: {bg_color}")
 
-        # Ensure directory exists
+        # The paths are built once and passed to the savers; save_file creates
+        # the directory if it is missing
         save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
+        file_path = save_path / filename_with_suffix(filename, suffix)
 
         # Capture screenshot
         self.logger.debug("Requesting screenshot from scope...")
@@ -250,15 +261,19 @@ class SimpleScope:
             self.logger.error(f"Failed to capture screenshot: {str(e)}", exc_info=True)
             raise
 
-        self.save_file(save_dir, filename, suffix, screenshot_data)  # Save the image data to disk
+        self.save_file(file_path, screenshot_data)  # Save the image data to disk
         # Save metadata if provided
         if metadata:
             self.logger.debug(f"Saving metadata: {list(metadata.keys())}")
             self.meta = metadata
-            self._save_metadata(save_dir, filename)
+            self._save_metadata(file_path)
 
-            # Update config with the metadata
-            self.config.last_used_metadata = metadata
+            # Update config with the metadata; repeat captures usually reuse the same
+            # values, so skip the snapshot/serialize when nothing changed (an in-place
+            # edit of the config's own dict still has to be saved)
+            last_used = self.config.last_used_metadata
+            if metadata is last_used or metadata != last_used:
+                self.config.update(last_used_metadata=metadata)
 
         # Update the config with the new directory
         self.config.set_save_directory(save_dir)
@@ -280,38 +295,59 @@ class SimpleScope:
         self.logger.info("Capture completed successfully")
         return screenshot_data
 
-    def _save_metadata(self, save_dir, filename):
+    def _save_metadata(self, path):
         """
         Save metadata to a companion text file
         
         Args:
-            save_dir (Path or str): Directory where the image is saved
-            filename (str): Filename of the image
+            path (Path): Path of the saved image
         """
         # Create metadata file path based on image path
-        path = Path(save_dir) / filename
-        metadata_path = path.with_stem(f"{path.stem}_metadata").with_suffix('.txt')
+        metadata_path = path.with_name(f"{path.stem}_metadata.txt")
         
+        lines = [f"Image file: {path.name}\n",
+                 f"Capture time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"]
+        if self.device_id:
+            lines.append(f"Device: {self.device_id}\n\n")
+
+        # Custom metadata
+        lines.append("Custom Metadata:\n")
+        lines.extend(f"{key}: {value}\n" for key, value in self.meta.items())
+
+        # Build the file in memory and write it in one call
         with open(metadata_path, 'w') as f:
-            f.write(f"Image file: {path.name}\n")
-            f.write(f"Capture time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            if self.device_id:
-                f.write(f"Device: {self.device_id}\n\n")
-            
-            # Write custom metadata
-            f.write("Custom Metadata:\n")
-            for key, value in self.meta.items():
-                f.write(f"{key}: {value}\n")
+            f.write("".join(lines))
         
         
-    def save_file(self, save_dir, filename, suffix, file_data):
-        filename = filename_with_suffix(filename, suffix)
-        file_path = Path(save_dir) / filename
+    def save_file(self, file_path, file_data):
+        """
+        Write image data to disk
+
+        Args:
+            file_path (Path): Full path of the file, including suffix
+            file_data (bytes): Data to write
 
-        with open(file_path, "wb") as file:
-            # file = open(fileName, "wb") # Save image data to local disk
-            file.write(file_data)
-            file.close()
+        Returns:
+            Path: file_path
+        """
+        # Write a temp file next to the target and rename it into place, so a
+        # synced/watched folder never sees a half-written image. Same directory,
+        # so os.replace is a plain rename (the system temp dir may be another volume).
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        try:
+            file = open(tmp_path, "wb")
+        except FileNotFoundError:
+            # Save directory is new, or was deleted/renamed since the last capture
+            os.makedirs(file_path.parent, exist_ok=True)
+            file = open(tmp_path, "wb")
+        try:
+            with file:
+                file.write(file_data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            # Disk full, permissions, interrupted: don't leave a hidden .tmp behind
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         self.logger.info(f"Saved: {file_path}")
 
@@ -353,8 +389,7 @@ class SimpleScope:
             Path to the saved log file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
-            filename = f"simple_scope_log_{timestamp}.txt"
+            filename = f"simple_scope_log_{datestamp()}.txt"
 
         log_path = self.config._app_data_dir / filename
         return self.log_handler.save(log_path, self.version)
@@ -2,13 +2,16 @@
 Utility functions for the Oscilloscope Screenshot Capture Application
 """
 
+from functools import cache, lru_cache
 from pathlib import Path
-import re
 import platform
 import subprocess
 import sys
 import os  # Kept for environment variables
-import datetime
+import time
+
+# OS name ("Windows", "Darwin", "Linux", ...); fixed for the life of the process
+_SYSTEM = platform.system()
 
 
 def get_resource_path(relative_path: str) -> Path:
@@ -42,11 +45,14 @@ def expand_environment_vars(path):
         Path: Path object with expanded environment variables
     """
     path_str = str(path)
+
+    # Most configured paths contain no variables or ~; skip the expansion work
+    if '%' not in path_str and '$' not in path_str and '~' not in path_str:
+        return Path(path_str)
     
     # Handle %USERNAME% style variables for Windows
-    if platform.system() == "Windows":
-        username_match = re.search(r'%USERNAME%', path_str)
-        if username_match:
+    if _SYSTEM == "Windows":
+        if '%USERNAME%' in path_str:
             username = os.environ.get('USERNAME', '')
             path_str = path_str.replace('%USERNAME%', username)
     
@@ -55,6 +61,23 @@ def expand_environment_vars(path):
     return expanded_path
 
 
+def _spawn_detached(args):
+    """Start a helper process without waiting for it (file managers report nothing back)"""
+    subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+# Opens a path in the platform's file manager; chosen once at import
+if _SYSTEM == "Windows":
+    _open_in_file_manager = os.startfile
+elif _SYSTEM == "Darwin":  # macOS
+    def _open_in_file_manager(path_str):
+        _spawn_detached(["open", path_str])
+else:  # Linux and other
+    def _open_in_file_manager(path_str):
+        _spawn_detached(["xdg-open", path_str])
+
+
 def open_file_explorer(path):
     """
     Open the file explorer at the specified path
@@ -66,12 +89,20 @@ def open_file_explorer(path):
     if not path_obj.exists():
         path_obj.mkdir(parents=True, exist_ok=True)
         
-    if platform.system() == "Windows":
-        os.startfile(str(path_obj))
-    elif platform.system() == "Darwin":  # macOS
-        subprocess.run(["open", str(path_obj)])
-    else:  # Linux and other
-        subprocess.run(["xdg-open", str(path_obj)])
+    _open_in_file_manager(str(path_obj))
+
+
+@cache
+def _system_info() -> tuple:
+    """System information as (key, value) pairs; platform.* can shell out, so run once"""
+    return (
+        ("system", _SYSTEM),
+        ("release", platform.release()),
+        ("version", platform.version()),
+        ("machine", platform.machine()),
+        ("processor", platform.processor()),
+        ("python_version", platform.python_version()),
+    )
 
 
 def get_system_info():
@@ -81,14 +112,7 @@ def get_system_info():
     Returns:
         dict: Dictionary with system information
     """
-    return {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
-        "python_version": platform.python_version(),
-    }
+    return dict(_system_info())
 
 
 def parse_visa_resource_string(resource_string):
@@ -106,32 +130,30 @@ def parse_visa_resource_string(resource_string):
         "type": "unknown",
     }
     
-    # Handle USB devices
-    usb_match = re.match(
-        r'USB[0-9]*::([0-9]*)::([0-9]*)::([^::]*)(?:::INSTR)?', 
-        resource_string
-    )
-    if usb_match:
+    # Fixed grammar (interface[board]::field::...), so a split beats a regex
+    parts = resource_string.split("::")
+    interface = parts[0].upper()
+
+    # Handle USB devices: USB[board]::vendor::product::serial[::interface]::INSTR
+    if interface.startswith("USB") and len(parts) >= 4:
         info["type"] = "usb"
-        info["vendor_id"] = usb_match.group(1)
-        info["product_id"] = usb_match.group(2)
-        info["serial_number"] = usb_match.group(3)
-    
-    # Handle TCPIP devices
-    tcpip_match = re.match(
-        r'TCPIP[0-9]*::([^::]*)::[0-9]*::SOCKET', 
-        resource_string
-    )
-    if tcpip_match:
+        info["vendor_id"] = parts[1]
+        info["product_id"] = parts[2]
+        info["serial_number"] = parts[3]
+
+    # Handle TCPIP devices: TCPIP[board]::host::port::SOCKET or ::device::INSTR
+    elif interface.startswith("TCPIP") and len(parts) >= 3:
         info["type"] = "tcpip"
-        info["address"] = tcpip_match.group(1)
-    
+        info["address"] = parts[1]
+
     return info
 
 
+@lru_cache(maxsize=256)
 def filename_with_suffix(filename: str, suffix: str) -> str: 
     """
-    Append suffix to filename before the extension
+    Append suffix to filename before the extension.
+    Pure function, memoized: repeated saves with the same name are a dict lookup
     
     Args:
         filename (str): Original filename
@@ -150,10 +172,31 @@ def filename_with_suffix(filename: str, suffix: str) -> str:
     return filename
 
 
+# (directory, stem, ext) -> last counter handed out by get_next_incremented_filename
+_next_counter_cache: dict[tuple[str, str, str], int] = {}
+
+
+def invalidate_filename_cache(directory=None):
+    """
+    Forget cached auto-increment counters, e.g. after files were deleted externally
+
+    Args:
+        directory (str or Path, optional): Only forget counters for this directory.
+            Defaults to clearing everything.
+    """
+    if directory is None:
+        _next_counter_cache.clear()
+        return
+    directory = os.path.normcase(os.fspath(directory))
+    for key in [key for key in _next_counter_cache if key[0] == directory]:
+        del _next_counter_cache[key]
+
+
 def get_next_incremented_filename(directory, base_filename, suffix):
     """
     Find the next available filename by appending _001, _002, etc.
-    Checks if file exists and increments until a free slot is found.
+    The first call for a directory/base name lists the directory once;
+    later calls resume from the last counter handed out.
 
     Args:
         directory (str or Path): Directory to check for existing files
@@ -163,32 +206,71 @@ def get_next_incremented_filename(directory, base_filename, suffix):
     Returns:
         str: Filename with incrementor appended (e.g., "capture_001.png")
     """
-    directory = Path(directory)
-    stem = Path(base_filename).stem
+    directory = os.fspath(directory)  # once, rather than in every os.path.join below
+    stem = os.path.splitext(os.path.basename(base_filename))[0]
     ext = suffix if suffix.startswith('.') else '.' + suffix
+    key = (os.path.normcase(directory), stem, ext)
 
-    counter = 1
+    counter = _next_counter_cache.get(key)
+    if counter is not None:
+        # Lower counters were already taken; only probe from the cached one up
+        def is_taken(name):
+            return os.path.exists(os.path.join(directory, name))
+    else:
+        # One directory listing instead of an exists() call per candidate;
+        # normcase keeps matching case-insensitive on Windows
+        try:
+            with os.scandir(directory) as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+
+        def is_taken(name):
+            return os.path.normcase(name) in existing
+        counter = 1
+
+    prefix = f"{stem}_"
     while True:
-        # Use zfill(3) for 001-999, allow natural growth beyond
-        if counter < 1000:
-            incrementor = str(counter).zfill(3)
-        else:
-            incrementor = str(counter)
-
-        new_filename = f"{stem}_{incrementor}{ext}"
-        filepath = directory / new_filename
+        # :03d pads 1-999 to 001-999 and grows naturally beyond
+        new_filename = f"{prefix}{counter:03d}{ext}"
 
-        if not filepath.exists():
+        if not is_taken(new_filename):
+            _next_counter_cache[key] = counter
             return new_filename
 
         counter += 1
 
 
+# Format used for datestamped filenames
+DATESTAMP_FORMAT = "%Y.%m.%d_%H.%M.%S"
+
+# (whole second, formatted stamp) of the last datestamp() call
+_datestamp_cache: tuple[int, str] = (-1, '')
+
+
+def datestamp() -> str:
+    """
+    Current local time formatted with DATESTAMP_FORMAT.
+    The stamp only changes once a second, so repeat calls within the same
+    second reuse the last string instead of calling strftime again.
+
+    Returns:
+        str: e.g. "2026.01.22_10.30.45"
+    """
+    global _datestamp_cache
+    second = int(time.time())
+    cached_second, stamp = _datestamp_cache
+    if second != cached_second:
+        stamp = time.strftime(DATESTAMP_FORMAT, time.localtime(second))
+        _datestamp_cache = (second, stamp)
+    return stamp
+
+
 def get_filename_with_datestamp(directory, base_filename, suffix):
     """
     Generate filename with datestamp appended, handling collisions.
-    If the timestamped filename already exists, waits 100ms and retries
-    (the timestamp will naturally change as time passes).
+    If the timestamped filename already exists (two captures in the same
+    second), an incrementor is appended instead of waiting for the clock.
 
     Args:
         directory (str or Path): Directory to check for existing files
@@ -196,23 +278,23 @@ def get_filename_with_datestamp(directory, base_filename, suffix):
         suffix (str): File extension (e.g., "png" or ".png")
 
     Returns:
-        str: Filename with datestamp appended (e.g., "capture_2026.01.22_10.30.45.png")
+        str: Filename with datestamp appended (e.g., "capture_2026.01.22_10.30.45.png",
+            or "capture_2026.01.22_10.30.45_001.png" on a collision)
     """
-    import time
-
-    directory = Path(directory)
-    stem = Path(base_filename).stem
+    directory = os.fspath(directory)
+    stem = os.path.splitext(os.path.basename(base_filename))[0]
     ext = suffix if suffix.startswith('.') else '.' + suffix
 
-    for _ in range(100):  # Try up to 100 times (~10 seconds max)
-        timestamp = datetime.datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
-        new_filename = f"{stem}_{timestamp}{ext}"
-        filepath = directory / new_filename
+    datestamp_str = datestamp()
+    new_filename = f"{stem}_{datestamp_str}{ext}"
+    if not os.path.exists(os.path.join(directory, new_filename)):
+        return new_filename
 
-        if not filepath.exists():
-            return new_filename
-
-        # Wait 100ms for timestamp to change
-        time.sleep(0.1)
-
-    raise ValueError("Could not generate unique filename after 100 attempts")
\ No newline at end of file
+    # Probe directly rather than via get_next_incremented_filename: a stamp is only
+    # ever reused within its own second, so caching its counter would just leak entries
+    counter = 1
+    while True:
+        candidate = f"{stem}_{datestamp_str}_{counter:03d}{ext}"
+        if not os.path.exists(os.path.join(directory, candidate)):
+            return candidate
+        counter += 1
\ No newline at end of file
@@ -7,10 +7,12 @@ Entry point for the application
 import sys
 import os
 from pathlib import Path
-from app.gui import ScopeCaptureGUI
 
 def main():
     """Main entry point for the application"""
+    # Imported here so tkinter and the app modules load after the chdir below
+    from app.gui import ScopeCaptureGUI
+
     app = ScopeCaptureGUI()
     app.mainloop()
 
@@ -24,6 +26,5 @@ if __name__ == "__main__":
         application_path = Path(__file__).parent
     
     # Change to application directory
-    # Path.cwd().chdir(application_path)
     os.chdir(application_path)
     main()
@@ -9,6 +9,14 @@ from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 datas = collect_data_files('pyvisa')
 datas += collect_data_files('pyvisa_py')
 
-# Collect all submodules to ensure they're included
+# pyvisa_py sessions the app doesn't use; leaving them out also keeps gpib-ctypes out.
+# The serial session stays: scans list ASRL resources and scopes with an RS-232
+# port can be reached over them
+_UNUSED_PYVISA_PY = ('pyvisa_py.gpib', 'pyvisa_py.prologix', 'pyvisa_py.testsuite')
+
+# Collect submodules to ensure they're included
 hiddenimports = collect_submodules('pyvisa')
-hiddenimports += collect_submodules('pyvisa_py')
+hiddenimports += collect_submodules(
+    'pyvisa_py',
+    filter=lambda name: not name.startswith(_UNUSED_PYVISA_PY),
+)